@@ -1,56 +1,79 @@
 # deps.py - Dependency utilities for FastAPI endpoints
 # Provides authentication and user retrieval dependencies.
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.security import decode_access_token
+import jwt
+from fastapi import Depends, HTTPException, Request, status
+from app.core.security import decode_access_token_cached
+from app.core import user_cache
 from app.domains.shared.crud.user import UserCRUD
 from app.domains.shared.crud.admin import AdminCRUD
 from app.dependencies import get_db
 
-bearer_scheme = HTTPBearer()
+
+async def _bearer_token(request: Request) -> str:
+    """
+    Extract the bearer token from the Authorization header.
+
+    A plain header parse; avoids HTTPBearer's per-request credential
+    object construction on every authenticated endpoint.
+    """
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        raise HTTPException(status_code=403, detail="Not authenticated")
+    scheme, _, token = authorization.partition(" ")
+    if not token or scheme.casefold() != "bearer":
+        raise HTTPException(status_code=403, detail="Invalid authentication credentials")
+    return token
 
 
 # --- Get Current Authenticated User Dependency ---
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    token: str = Depends(_bearer_token),
     db=Depends(get_db)
 ):
     """
     Retrieve the current authenticated user from the JWT token.
     """
-    token = credentials.credentials
+    # Only token failures map to 401 here; DB errors propagate to the
+    # app-level exception handlers instead of masquerading as auth failures.
     try:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        payload = decode_access_token_cached(token)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    user = user_cache.get_user(user_id)
+    if user is None:
         user = await UserCRUD(db).get_by_id(user_id)
         if not user:
             raise HTTPException(status_code=401, detail="User not found")
-        return user
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+        user_cache.put_user(user)
+    return user
 
 
 # --- Get Current Authenticated Admin Dependency ---
 async def get_current_admin(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    token: str = Depends(_bearer_token),
     db=Depends(get_db)
 ):
     """
     Retrieve the current authenticated admin from the JWT token.
     Raises 403 if the user is not an admin.
     """
-    token = credentials.credentials
     try:
-        payload = decode_access_token(token)
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token")
+        payload = decode_access_token_cached(token)
+    except jwt.PyJWTError:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    user_id = payload.get("sub")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    admin = user_cache.get_admin(user_id)
+    if admin is None:
         admin = await AdminCRUD(db).get_by_user_id(user_id)
         if not admin or not getattr(admin, "is_active", True):
             raise HTTPException(status_code=403, detail="Not an active admin")
-        return admin
-    except Exception:
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+        user_cache.put_admin(admin)
+    elif not admin.is_active:
+        raise HTTPException(status_code=403, detail="Not an active admin")
+    return admin
@@ -1,10 +1,14 @@
 # health.py - Health check endpoint for FastAPI application
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 
 router = APIRouter(tags=["health"])
 
+# Encoded once; load balancers poll this endpoint constantly and the
+# payload never changes.
+_HEALTH_BODY = b'{"status":"healthy"}'
+
 
 # --- Health Check Endpoint ---
 @router.get("/")
@@ -13,4 +17,4 @@ async def health_check():
     Health check endpoint.
     Returns a simple status message indicating the service is running.
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
@@ -9,11 +9,17 @@ from app.domains.shared.crud.admin import AdminCRUD
 from app.dependencies import get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_admin
+from app.core import user_cache
 from app.core.exceptions import NotFoundError, PermissionError
+from pydantic import TypeAdapter
 
 
 router = APIRouter(tags=["admins"])
 
+# Validates a whole page of rows in one pydantic-core call instead of
+# one model_validate per row.
+_ADMIN_LIST_ADAPTER = TypeAdapter(list[AdminRead])
+
 
 def get_admin_service(db: AsyncSession = Depends(get_db)) -> AdminService:
     admin_crud = AdminCRUD(db)
@@ -32,7 +38,8 @@ async def create_admin(
 ):
     try:
         admin = await admin_service.create_admin(admin_in, current_admin)
-        return AdminRead.model_validate(admin)
+        user_cache.invalidate_admins()
+        return AdminRead.from_orm_fast(admin)
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
@@ -57,7 +64,7 @@ async def list_admins(
     has_next = skip + per_page < total
     has_prev = page > 1
     return AdminList(
-        admins=[AdminRead.model_validate(a) for a in admins],
+        admins=_ADMIN_LIST_ADAPTER.validate_python(admins, from_attributes=True),
         total=total,
         page=page,
         per_page=per_page,
@@ -76,7 +83,7 @@ async def get_admin(
         admin = await admin_service.get_admin(admin_id, current_admin)
         if not admin:
             raise HTTPException(status_code=404, detail="Admin not found")
-        return AdminRead.model_validate(admin)
+        return AdminRead.from_orm_fast(admin)
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
@@ -90,7 +97,8 @@ async def update_admin(
 ):
     try:
         updated_admin = await admin_service.update_admin(admin_id, admin_update, current_admin)
-        return AdminRead.model_validate(updated_admin)
+        user_cache.invalidate_admins()
+        return AdminRead.from_orm_fast(updated_admin)
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
     except NotFoundError:
@@ -107,6 +115,7 @@ async def delete_admin(
         deleted = await admin_service.delete_admin(admin_id, acting_admin=current_admin)
         if not deleted:
             raise HTTPException(status_code=404, detail="Admin not found")
+        user_cache.invalidate_admins()
         return None
     except PermissionError as e:
         raise HTTPException(status_code=403, detail=str(e))
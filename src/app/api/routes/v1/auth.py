@@ -12,7 +12,8 @@ from app.core.security import create_access_token
 from pydantic import BaseModel
 from fastapi.responses import JSONResponse
 from app.core.exceptions import AuthenticationError
-from app.core.rate_limiter import RateLimiter
+from app.core.rate_limiter import RateLimiter, ConcurrentRateLimiter
+from app.config import settings
 
 
 router = APIRouter(tags=["auth"])
@@ -35,7 +36,10 @@ def get_auth_service(db: AsyncSession = Depends(get_db)) -> AuthService:
 @router.post(
     "/login",
     response_model=TokenResponse,
-    dependencies=[Depends(RateLimiter(times=5, seconds=60))]
+    dependencies=[
+        Depends(RateLimiter(times=5, seconds=60)),
+        Depends(ConcurrentRateLimiter(max_concurrent=settings.MAX_LOGIN_CONCURRENCY)),
+    ]
 )
 async def login_user(
     login_data: UserLogin,
@@ -2,6 +2,7 @@
 # Handles user registration, listing, retrieval, update, password change, activity summary, and deletion.
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from uuid import UUID
 from app.domains.shared.schemas.user import (
@@ -11,10 +12,13 @@ from app.domains.shared.crud.user import UserCRUD
 from app.domains.shared.crud.audit_log import AuditLogCRUD
 from app.domains.shared.services.user_service import UserService
 from app.dependencies import get_db
+from app.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_current_user
-from app.core.rate_limiter import RateLimiter
+from app.core import user_cache
+from app.core.rate_limiter import RateLimiter, ConcurrentRateLimiter
 from app.utils.logging import get_logger
+from pydantic import TypeAdapter
 
 
 logger = get_logger(__name__)
@@ -22,6 +26,10 @@ logger = get_logger(__name__)
 
 router = APIRouter(tags=["users"])
 
+# Validates a whole page of rows in one pydantic-core call instead of
+# one model_validate per row.
+_USER_LIST_ADAPTER = TypeAdapter(list[UserRead])
+
 
 # Dependency to get the user service
 def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
@@ -35,7 +43,10 @@ def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
     "/",
     response_model=UserRead,
     status_code=status.HTTP_201_CREATED,
-    dependencies=[Depends(RateLimiter(times=3, seconds=60))]
+    dependencies=[
+        Depends(RateLimiter(times=3, seconds=60)),
+        Depends(ConcurrentRateLimiter(max_concurrent=settings.MAX_LOGIN_CONCURRENCY)),
+    ]
 )
 async def register_user(
     user_in: UserCreate,
@@ -47,7 +58,7 @@ async def register_user(
     """
     user = await user_service.create_user(user_in)
     background_tasks.add_task(user_service.send_email_verification, user)
-    return UserRead.model_validate(user)
+    return UserRead.from_orm_fast(user)
 
 
 # --- List Users (with pagination and filters) ---
@@ -76,7 +87,7 @@ async def list_users(
     has_next = skip + per_page < total
     has_prev = page > 1
     return UserList(
-        users=[UserRead.model_validate(u) for u in users],
+        users=_USER_LIST_ADAPTER.validate_python(users, from_attributes=True),
         total=total,
         page=page,
         per_page=per_page,
@@ -85,6 +96,32 @@ async def list_users(
     )
 
 
+# --- Export Users (streaming) ---
+@router.get("/export")
+async def export_users(
+    is_active: Optional[bool] = None,
+    email_verified: Optional[bool] = None,
+    search: Optional[str] = None,
+    user_service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_user),
+):
+    """
+    Stream matching users as NDJSON, one row per line.
+
+    Rows go out as the driver fetches them, so exports of any size hold
+    at most one fetch batch in memory.
+    """
+    async def _rows():
+        async for user in user_service.aiter_users(
+            is_active=is_active,
+            email_verified=email_verified,
+            search=search,
+        ):
+            yield UserRead.from_orm_fast(user).model_dump_json() + "\n"
+
+    return StreamingResponse(_rows(), media_type="application/x-ndjson")
+
+
 # --- Get User by ID ---
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user(
@@ -98,7 +135,7 @@ async def get_user(
     user = await user_service.get_user(user_id, acting_user=current_user)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return UserRead.model_validate(user)
+    return UserRead.from_orm_fast(user)
 
 
 # --- Update User ---
@@ -113,7 +150,8 @@ async def update_user(
     Update user information.
     """
     updated_user = await user_service.update_user(user_id, user_update, updated_by=current_user.id, acting_user=current_user)
-    return UserRead.model_validate(updated_user)
+    user_cache.invalidate_user(user_id)
+    return UserRead.from_orm_fast(updated_user)
 
 
 # --- Change User Password ---
@@ -128,6 +166,8 @@ async def change_password(
     Change the password for a user.
     """
     success = await user_service.change_password(user_id, password_data, acting_user=current_user)
+    if success:
+        user_cache.invalidate_user(user_id)
     if not success:
         raise HTTPException(status_code=400, detail="Password change failed")
     return True
@@ -164,4 +204,5 @@ async def delete_user(
         deleted = await user_service.delete_user(user_id, acting_user=current_user)
     if not deleted:
         raise HTTPException(status_code=404, detail="User not found")
+    user_cache.invalidate_user(user_id)
     return None
@@ -1,3 +1,4 @@
+from dataclasses import make_dataclass
 from pydantic_settings import BaseSettings
 from pydantic import EmailStr
 from uuid import UUID
@@ -11,6 +12,18 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # TTL (seconds) for the in-process auth principal cache; 0 disables it.
+    AUTH_USER_CACHE_TTL: int = 5
+    # Worker threads for bcrypt hashing/verification off the event loop.
+    BCRYPT_POOL_SIZE: int = 4
+    # Skip pydantic revalidation when converting trusted DB rows to schemas.
+    TRUST_DB_SCHEMA: bool = True
+    # Max in-flight login/registration requests per client IP.
+    MAX_LOGIN_CONCURRENCY: int = 3
+    # Accept already-canonical E.164 phone numbers on shape alone,
+    # skipping the phonenumbers metadata parse and its per-region
+    # validity check. Off by default: weakening validation is opt-in.
+    FAST_PHONE_VALIDATION: bool = False
 
     # Database
     DATABASE_URL: str
@@ -49,3 +62,21 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+
+def _freeze(source: Settings):
+    """Snapshot settings into a frozen slotted dataclass for fast attribute reads."""
+    data = source.model_dump()
+    frozen_cls = make_dataclass(
+        "FrozenSettings",
+        [(key, object) for key in data],
+        frozen=True,
+        slots=True,
+    )
+    return frozen_cls(**data)
+
+
+# Hot paths (token encode/decode, session init) read from this mirror;
+# slot access skips pydantic's __getattr__ machinery. `settings` stays
+# the source of truth for everything else.
+FROZEN_SETTINGS = _freeze(settings)
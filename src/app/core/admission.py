@@ -0,0 +1,91 @@
+# admission.py - AIMD admission control for DB-bound request handling
+# Applies TCP-style congestion control to the number of requests allowed
+# to hold a DB session concurrently: additive increase while latency is
+# healthy, multiplicative decrease on slowdowns or errors.
+
+import asyncio
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from app.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# AIMD parameters: grow by ALPHA per healthy window, shrink by BETA on
+# p95 latency above target or on server errors.
+ALPHA = 0.5
+BETA = 0.5
+TARGET_P95_MS = 250.0
+SAMPLE_WINDOW = 50
+
+MIN_CONCURRENCY = 2
+MAX_CONCURRENCY = 64
+INITIAL_CONCURRENCY = 10
+
+
+class AIMDAdmissionController:
+    """Admission gate whose concurrency limit adapts to observed latency."""
+
+    def __init__(
+        self,
+        initial: int = INITIAL_CONCURRENCY,
+        min_limit: int = MIN_CONCURRENCY,
+        max_limit: int = MAX_CONCURRENCY,
+        target_p95_ms: float = TARGET_P95_MS,
+        window: int = SAMPLE_WINDOW,
+    ):
+        self._limit = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_p95_ms = target_p95_ms
+        self._window = window
+        self._in_flight = 0
+        self._samples: list = []
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one admission slot for the duration of the request."""
+        async with self._cond:
+            while self._in_flight >= self.limit:
+                await self._cond.wait()
+            self._in_flight += 1
+        # Sample from acquisition to release, so queue wait in this gate
+        # never counts as "latency" — otherwise backlog inflates the
+        # signal, which shrinks the limit, which grows the backlog.
+        held_from = perf_counter()
+        try:
+            yield
+        finally:
+            latency_ms = (perf_counter() - held_from) * 1000
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+            self.record_latency(latency_ms)
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Feed one request latency sample; adjusts the limit every window."""
+        self._samples.append(latency_ms)
+        if len(self._samples) < self._window:
+            return
+        samples = sorted(self._samples)
+        self._samples.clear()
+        p95 = samples[max(int(len(samples) * 0.95) - 1, 0)]
+        if p95 <= self._target_p95_ms:
+            self._limit = min(self._limit + ALPHA, self._max_limit)
+        else:
+            self._limit = max(self._limit * BETA, self._min_limit)
+            logger.warning(
+                "Admission limit reduced to %d (p95=%.0fms)", self.limit, p95
+            )
+
+    def record_error(self) -> None:
+        """Back off immediately on server errors/timeouts."""
+        self._limit = max(self._limit * BETA, self._min_limit)
+
+
+db_admission = AIMDAdmissionController()
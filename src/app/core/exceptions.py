@@ -2,54 +2,77 @@
 # Defines domain-specific exceptions for error handling.
 
 
-class DatabaseError(Exception):
+class AppError(Exception):
+    """Base class for application exceptions.
+
+    A single base lets the app register one exception handler that
+    dispatches on concrete type instead of one handler per class.
+    """
+    __slots__ = ()
+
+
+class DatabaseError(AppError):
     """Wrapper for database operation failures."""
+    __slots__ = ("message", "original_error")
+
     def __init__(self, message: str, original_error: Exception = None):
         self.message = message
         self.original_error = original_error
         super().__init__(self.message)
 
 
-class ConflictError(Exception):
+class ConflictError(AppError):
     """Raised when resource constraints are violated."""
+    __slots__ = ("message", "field")
+
     def __init__(self, message: str, field: str = None):
         self.message = message
         self.field = field
         super().__init__(self.message)
 
 
-class NotFoundError(Exception):
+class NotFoundError(AppError):
     """Raised when a requested resource doesn't exist."""
+    __slots__ = ("message", "resource_type")
+
     def __init__(self, message: str, resource_type: str = None):
         self.message = message
         self.resource_type = resource_type
         super().__init__(self.message)
 
 
-class ValidationError(Exception):
+class ValidationError(AppError):
     """Raised when data validation fails."""
+    __slots__ = ("message", "field")
+
     def __init__(self, message: str, field: str = None):
         self.message = message
         self.field = field
         super().__init__(self.message)
 
 
-class AuthenticationError(Exception):
+class AuthenticationError(AppError):
     """Raised when authentication fails."""
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Authentication failed"):
         self.message = message
         super().__init__(self.message)
 
 
-class AuthorizationError(Exception):
+class AuthorizationError(AppError):
     """Raised when user lacks required permissions."""
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Insufficient permissions"):
         self.message = message
         super().__init__(self.message)
 
 
-class PermissionError(Exception):
+class PermissionError(AppError):
     """Raised when a user does not have permission to perform an action."""
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Permission denied"):
         self.message = message
         super().__init__(self.message)
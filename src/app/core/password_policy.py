@@ -1,4 +1,8 @@
-import re
+# Byte LUT over the ASCII range: indexing a bytes object is a C array
+# load, versus hash-and-probe for a set membership test per character.
+# Every special character is ASCII, so non-ASCII input just misses.
+_SPECIAL_LUT = bytes(1 if chr(i) in '!@#$%^&*(),.?":{}|<>' else 0 for i in range(128))
+_WEAK_PASSWORDS = frozenset({'password', '12345678', 'qwerty123'})
 
 
 class PasswordPolicy:
@@ -20,14 +24,29 @@ class PasswordPolicy:
             raise ValueError("Password must be at least 8 characters long")
         if len(password) > 128:
             raise ValueError("Password cannot exceed 128 characters")
-        if not any(c.isupper() for c in password):
+
+        # Single pass over the password instead of one scan per character class.
+        has_upper = has_lower = has_digit = has_special = False
+        for c in password:
+            if c.isupper():
+                has_upper = True
+            elif c.islower():
+                has_lower = True
+            elif c.isdigit():
+                has_digit = True
+            elif (o := ord(c)) < 128 and _SPECIAL_LUT[o]:
+                has_special = True
+            if has_upper and has_lower and has_digit and has_special:
+                break
+
+        if not has_upper:
             raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in password):
+        if not has_lower:
             raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in password):
+        if not has_digit:
             raise ValueError("Password must contain at least one digit")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password):
+        if not has_special:
             raise ValueError("Password must contain at least one special character")
-        if password.lower() in ['password', '12345678', 'qwerty123']:
+        if password.lower() in _WEAK_PASSWORDS:
             raise ValueError("Password is too common and easily guessable")
         return password
@@ -1,19 +1,16 @@
-from typing import List
-
-
-# Define permission constants
-ADMIN_PERMISSIONS = [
+# Define permission constants (frozensets: membership checks are O(1)
+# and the collections are immutable by intent).
+ADMIN_PERMISSIONS = frozenset({
     "manage_users",
     "view_reports",
     "edit_settings",
-]
+})
 
 
-SUPERADMIN_PERMISSIONS = [
-    *ADMIN_PERMISSIONS,
+SUPERADMIN_PERMISSIONS = ADMIN_PERMISSIONS | {
     "manage_admins",
     "system_settings",
-]
+}
 
 
 def has_permission(admin, permission: str) -> bool:
@@ -1,3 +1,7 @@
+import secrets
+import time
+
+from fastapi import HTTPException, Request
 from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter
 import redis.asyncio as redis
@@ -9,5 +13,61 @@ async def init_rate_limiter(redis_url: str):
     await FastAPILimiter.init(redis_client)
 
 
+# Rolling-window concurrency check executed atomically server-side:
+# drop expired members, count in-flight requests, admit-and-record or reject.
+_CONCURRENT_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local max_concurrent = tonumber(ARGV[3])
+local member = ARGV[4]
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= max_concurrent then
+    return 0
+end
+redis.call('ZADD', key, now, member)
+redis.call('EXPIRE', key, window)
+return 1
+"""
+
+
+class ConcurrentRateLimiter:
+    """
+    Bounds in-flight requests per client IP using a Redis sorted set.
+
+    Unlike the fixed-window RateLimiter, this caps how many requests from one
+    client can be active at once (e.g. concurrent bcrypt verifications on
+    /login), and the single Lua script avoids multi-round-trip races.
+    """
+
+    def __init__(self, max_concurrent: int, window_seconds: int = 60):
+        self.max_concurrent = max_concurrent
+        self.window_seconds = window_seconds
+
+    async def __call__(self, request: Request):
+        client_host = request.client.host if request.client else "unknown"
+        key = f"concurrent-limiter:{request.scope['path']}:{client_host}"
+        member = secrets.token_hex(4)
+
+        allowed = await FastAPILimiter.redis.eval(
+            _CONCURRENT_LUA,
+            1,
+            key,
+            time.time(),
+            self.window_seconds,
+            self.max_concurrent,
+            member,
+        )
+        if not allowed:
+            raise HTTPException(status_code=429, detail="Too many concurrent requests")
+        try:
+            yield
+        finally:
+            # Yield dependency: the finally runs whether the endpoint
+            # returned or raised, so a failed login (401) frees its slot
+            # instead of holding it for the rest of the window.
+            await FastAPILimiter.redis.zrem(key, member)
+
+
 # Re-export RateLimiter for easy import in routes
-__all__ = ["RateLimiter", "init_rate_limiter"]
+__all__ = ["RateLimiter", "ConcurrentRateLimiter", "init_rate_limiter"]
@@ -0,0 +1,48 @@
+# request_cache.py - Per-request identity cache for CRUD lookups.
+#
+# Within a single HTTP request, several layers (dependencies, services,
+# CRUD pre-checks) often fetch the same row. The cache lives in a
+# ContextVar activated by the get_db dependency, so entries never leak
+# across requests and there is no locking.
+
+import functools
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_store: ContextVar[Optional[Dict[Tuple[str, str], Any]]] = ContextVar(
+    "request_cache", default=None
+)
+
+
+def activate() -> None:
+    """Start a fresh cache for the current request."""
+    _store.set({})
+
+
+def invalidate() -> None:
+    """Drop all cached lookups after a write in the current request."""
+    store = _store.get()
+    if store:
+        store.clear()
+
+
+def cached_lookup(func: Callable) -> Callable:
+    """
+    Serve repeated single-key CRUD lookups from the request cache.
+
+    Only plain positional lookups are cached; calls with extra arguments
+    (e.g. include_relationships=True) always hit the database.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, value, *args, **kwargs):
+        store = _store.get()
+        if store is None or args or kwargs:
+            return await func(self, value, *args, **kwargs)
+        key = (func.__qualname__, str(value))
+        if key in store:
+            return store[key]
+        obj = await func(self, value)
+        if obj is not None:
+            store[key] = obj
+        return obj
+    return wrapper
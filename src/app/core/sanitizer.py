@@ -1,13 +1,16 @@
 import html
 import re
-import phonenumbers
+
+# Compiled once at import; these run on the register/login hot paths.
+_USERNAME_RE = re.compile(r"[^\w]+")
+_escape = html.escape
 
 
 def sanitize_string(value: str) -> str:
     """Trim whitespace and escape HTML."""
     if not isinstance(value, str):
         return value
-    return html.escape(value.strip())
+    return _escape(value.strip())
 
 
 def sanitize_email(email: str) -> str:
@@ -21,17 +24,36 @@ def sanitize_username(username: str) -> str:
     """Trim and remove unsafe characters from username (allow only letters, numbers, underscores)."""
     if not isinstance(username, str):
         return username
-    username = username.strip()
     # Remove anything that's not a letter, number, or underscore
-    return re.sub(r"[^\w]", "", username)
+    return _USERNAME_RE.sub("", username.strip())
+
+
+def sanitize_identifier(identifier: str) -> str:
+    """Normalize a login identifier (email or username) in one pass.
+
+    Branches once on identifier kind and lowercases once; callers get a
+    value ready for the case-insensitive auth lookup with no further
+    string work.
+    """
+    if not isinstance(identifier, str):
+        return identifier
+    identifier = identifier.strip()
+    if "@" in identifier:
+        return identifier.lower()
+    return _USERNAME_RE.sub("", identifier).lower()
 
 
 def sanitize_phone(
     phone: str,
     region: str = "US",
-    fmt=phonenumbers.PhoneNumberFormat.E164
+    fmt=None
 ) -> str:
     """Normalize phone number to the specified format (default E.164)."""
+    # Imported lazily: phonenumbers is heavy and most requests never touch it.
+    import phonenumbers
+
+    if fmt is None:
+        fmt = phonenumbers.PhoneNumberFormat.E164
     try:
         parsed = phonenumbers.parse(phone, region)
         if phonenumbers.is_valid_number(parsed):
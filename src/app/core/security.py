@@ -1,29 +1,59 @@
 # security.py - Security utilities for FastAPI application
 # Handles password hashing, token generation, and JWT operations.
 
-from passlib.context import CryptContext
+import asyncio
+import functools
 import secrets
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import timedelta
 
-import jwt
-from app.config import settings
+from cachetools import TTLCache
+from app.config import FROZEN_SETTINGS as settings
 from app.utils.date import utcnow
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 ALGORITHM = "HS256"
 
 
-def get_password_hash(password: str) -> str:
+@functools.cache
+def _get_pwd_context():
+    """Build the passlib context on first use; loading the bcrypt backend is slow."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# Encoded once at import so every encode/decode skips the per-call
+# str.encode and list construction.
+_SECRET_BYTES = settings.SECRET_KEY.encode()
+_ALGORITHMS = [ALGORITHM]
+
+# Short-lived cache of verified token payloads so repeated requests from the
+# same client skip the base64+JSON+HMAC work. TTL is kept well below token
+# lifetime; expiry is still re-checked on every hit.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+_token_cache_lock = threading.Lock()
+
+
+# Bcrypt takes tens to hundreds of milliseconds per call; run it in a thread
+# pool so it does not block the event loop while login requests are in flight.
+_bcrypt_pool = ThreadPoolExecutor(max_workers=settings.BCRYPT_POOL_SIZE)
+
+
+async def get_password_hash(password: str) -> str:
     """Generate secure hash for password storage using bcrypt."""
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, _get_pwd_context().hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify plain password against hashed version with timing attack protection."""
-    return pwd_context.verify(plain_password, hashed_password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _bcrypt_pool, _get_pwd_context().verify, plain_password, hashed_password
+    )
 
 
 def generate_secure_token(length: int = 32) -> str:
@@ -32,9 +62,15 @@ def generate_secure_token(length: int = 32) -> str:
 
 
 def generate_password_reset_token(user_id: str, timestamp: str) -> str:
-    """Generate secure password reset token."""
+    """Generate secure password reset token.
+
+    Uses BLAKE2b (faster than SHA-256 in CPython, still cryptographically
+    strong); the secrecy comes from the random nonce. Reset tokens issued
+    before the SHA-256 -> BLAKE2b switch no longer verify, which is
+    acceptable for short-lived tokens.
+    """
     data = f"{user_id}:{timestamp}:{secrets.token_urlsafe(16)}"
-    return hashlib.sha256(data.encode()).hexdigest()
+    return hashlib.blake2b(data.encode(), digest_size=32).hexdigest()
 
 
 def verify_password_reset_token(token: str, user_id: str, timestamp: str, max_age_hours: int = 24) -> bool:
@@ -55,19 +91,42 @@ def verify_password_reset_token(token: str, user_id: str, timestamp: str, max_ag
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
+    import jwt
+
     to_encode = data.copy()
     expire = utcnow() + (expires_delta or timedelta(minutes=60))
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_access_token(token: str) -> dict:
-    """Decode a JWT access token."""
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    """Decode a JWT access token.
+
+    Raises jwt.ExpiredSignatureError / jwt.InvalidTokenError so callers can
+    handle token failures without a catch-all.
+    """
+    import jwt
+
+    return jwt.decode(token, _SECRET_BYTES, algorithms=_ALGORITHMS)
+
+
+def decode_access_token_cached(token: str) -> dict:
+    """Decode a JWT access token, serving repeated tokens from a short TTL cache."""
+    # Key by a digest rather than the raw token to avoid holding tokens in memory.
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _token_cache_lock:
+        payload = _token_cache.get(cache_key)
+
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is not None and exp <= utcnow().timestamp():
+            import jwt
+            raise jwt.ExpiredSignatureError("Token expired")
         return payload
-    except jwt.ExpiredSignatureError:
-        raise Exception("Token expired")
-    except jwt.InvalidTokenError:
-        raise Exception("Invalid token")
+
+    payload = decode_access_token(token)
+    with _token_cache_lock:
+        _token_cache[cache_key] = payload
+    return payload
@@ -0,0 +1,92 @@
+# user_cache.py - Short-TTL in-process cache for authenticated principals
+# Avoids one DB roundtrip per authenticated request in the auth dependencies.
+
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from cachetools import TTLCache
+
+from app.config import FROZEN_SETTINGS as settings
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Detached snapshot of a user row, safe to share across requests."""
+    id: UUID
+    username: str
+    email: str
+    is_active: bool
+    is_superuser: bool
+    email_verified: bool
+
+
+@dataclass(frozen=True)
+class CachedAdmin:
+    """Detached snapshot of an admin row, safe to share across requests."""
+    id: UUID
+    user_id: UUID
+    role: str
+    is_active: bool
+
+
+_ttl = settings.AUTH_USER_CACHE_TTL
+_enabled = _ttl > 0
+
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_ttl or 1)
+_admin_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_ttl or 1)
+_lock = threading.Lock()
+
+
+def get_user(user_id) -> Optional[CachedUser]:
+    if not _enabled:
+        return None
+    with _lock:
+        return _user_cache.get(str(user_id))
+
+
+def put_user(user) -> None:
+    if not _enabled:
+        return
+    snapshot = CachedUser(
+        id=user.id,
+        username=user.username,
+        email=user.email,
+        is_active=user.is_active,
+        is_superuser=user.is_superuser,
+        email_verified=user.email_verified,
+    )
+    with _lock:
+        _user_cache[str(user.id)] = snapshot
+
+
+def invalidate_user(user_id) -> None:
+    with _lock:
+        _user_cache.pop(str(user_id), None)
+
+
+def get_admin(user_id) -> Optional[CachedAdmin]:
+    if not _enabled:
+        return None
+    with _lock:
+        return _admin_cache.get(str(user_id))
+
+
+def put_admin(admin) -> None:
+    if not _enabled:
+        return
+    snapshot = CachedAdmin(
+        id=admin.id,
+        user_id=admin.user_id,
+        role=admin.role,
+        is_active=getattr(admin, "is_active", True),
+    )
+    with _lock:
+        _admin_cache[str(admin.user_id)] = snapshot
+
+
+def invalidate_admins() -> None:
+    """Drop all cached admins; admin mutations are rare enough to clear wholesale."""
+    with _lock:
+        _admin_cache.clear()
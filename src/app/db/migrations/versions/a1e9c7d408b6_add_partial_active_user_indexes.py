@@ -0,0 +1,37 @@
+"""Add partial indexes for active-user listings
+
+Revision ID: a1e9c7d408b6
+Revises: d6c31e84f7a2
+Create Date: 2026-08-28 12:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'a1e9c7d408b6'
+down_revision = 'd6c31e84f7a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # A full btree on a boolean is useless; partial indexes matching the
+    # common is_active (and email_verified) list filters are tiny and
+    # already sorted in the default created_at DESC listing order.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_active_created "
+        "ON users (created_at DESC) WHERE is_active"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_active_verified_created "
+        "ON users (created_at DESC) WHERE is_active AND email_verified"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS idx_users_active_verified_created")
+    op.execute("DROP INDEX IF EXISTS idx_users_active_created")
@@ -0,0 +1,32 @@
+"""Add GIN index on audit_logs.details for JSONB containment queries
+
+Revision ID: b8d14f6a92e3
+Revises: f2b84a0d51c9
+Create Date: 2026-08-28 11:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'b8d14f6a92e3'
+down_revision = 'f2b84a0d51c9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # Without this, any details @> ... filter seq-scans the audit table.
+    # jsonb_path_ops indexes are smaller than the default opclass and
+    # support exactly the containment operator we need.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_audit_details_gin "
+        "ON audit_logs USING gin (details jsonb_path_ops)"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS idx_audit_details_gin")
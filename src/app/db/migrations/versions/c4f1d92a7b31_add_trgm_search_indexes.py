@@ -0,0 +1,42 @@
+"""Add pg_trgm GIN indexes for LIKE-based search
+
+Revision ID: c4f1d92a7b31
+Revises: be08e6172a67
+Create Date: 2026-08-28 11:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'c4f1d92a7b31'
+down_revision = 'be08e6172a67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Unanchored '%term%' LIKE filters in user/admin search cannot use btree
+    # indexes; trigram GIN indexes turn them into index scans.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_username_trgm "
+        "ON users USING gin (lower(username) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_email_trgm "
+        "ON users USING gin (lower(email) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_admin_notes_trgm "
+        "ON admins USING gin (lower(notes) gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS idx_admin_notes_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_users_email_trgm")
+    op.execute("DROP INDEX IF EXISTS idx_users_username_trgm")
@@ -0,0 +1,38 @@
+"""Drop the composite boolean login indexes
+
+Revision ID: c9f0b2a61d84
+Revises: a1e9c7d408b6
+Create Date: 2026-08-28 12:25:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'c9f0b2a61d84'
+down_revision = 'a1e9c7d408b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # The login lookup filters on lower(email)/lower(username), served by
+    # the unique functional indexes from e7a530c64d18; nothing queries on
+    # the raw (col, is_active) pairs, so the composites only amplify
+    # writes.
+    op.execute("DROP INDEX IF EXISTS idx_user_email_active")
+    op.execute("DROP INDEX IF EXISTS idx_user_username_active")
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_email_active "
+        "ON users (email, is_active)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_user_username_active "
+        "ON users (username, is_active)"
+    )
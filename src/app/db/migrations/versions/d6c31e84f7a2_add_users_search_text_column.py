@@ -0,0 +1,40 @@
+"""Add generated users.search_text column with trigram index
+
+Revision ID: d6c31e84f7a2
+Revises: b8d14f6a92e3
+Create Date: 2026-08-28 11:55:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'd6c31e84f7a2'
+down_revision = 'b8d14f6a92e3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # Cross-field search OR'd three LIKE patterns; with one pattern per
+    # column the planner may settle on a single per-column index. A stored
+    # generated column with one trigram index guarantees a single bitmap
+    # scan no matter which field matches.
+    op.execute(
+        "ALTER TABLE users ADD COLUMN search_text text "
+        "GENERATED ALWAYS AS ("
+        "lower(username) || ' ' || lower(email) || ' ' || coalesce(phone_number, '')"
+        ") STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS users_search_trgm "
+        "ON users USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS users_search_trgm")
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS search_text")
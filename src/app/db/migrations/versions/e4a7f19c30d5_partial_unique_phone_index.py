@@ -0,0 +1,40 @@
+"""Swap phone_number unique index for a partial one
+
+Revision ID: e4a7f19c30d5
+Revises: c9f0b2a61d84
+Create Date: 2026-08-28 12:45:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'e4a7f19c30d5'
+down_revision = 'c9f0b2a61d84'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # Most users have no phone number; the full unique index carried an
+    # entry per NULL row. The partial index keeps identical uniqueness
+    # semantics (NULLs are distinct anyway) while staying tiny. Build the
+    # replacement before dropping the old index so lookups never lose
+    # coverage; use CREATE UNIQUE INDEX CONCURRENTLY when applying this
+    # to a busy production table.
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_user_phone_not_null "
+        "ON users (phone_number) WHERE phone_number IS NOT NULL"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_users_phone_number")
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_phone_number "
+        "ON users (phone_number)"
+    )
+    op.execute("DROP INDEX IF EXISTS uq_user_phone_not_null")
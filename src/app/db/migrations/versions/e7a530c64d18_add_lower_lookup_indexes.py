@@ -0,0 +1,41 @@
+"""Add functional lower() indexes for case-insensitive lookups
+
+Revision ID: e7a530c64d18
+Revises: c4f1d92a7b31
+Create Date: 2026-08-28 11:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'e7a530c64d18'
+down_revision = 'c4f1d92a7b31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # get_by_email/get_by_username/_check_uniqueness all filter on
+    # lower(col); without these the DB seq-scans users on every login.
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email_lower "
+        "ON users (lower(email))"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username_lower "
+        "ON users (lower(username))"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_email_pattern "
+        "ON users (email text_pattern_ops)"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS idx_users_email_pattern")
+    op.execute("DROP INDEX IF EXISTS idx_users_username_lower")
+    op.execute("DROP INDEX IF EXISTS idx_users_email_lower")
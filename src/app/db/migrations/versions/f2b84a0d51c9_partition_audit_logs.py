@@ -0,0 +1,121 @@
+"""Range-partition audit_logs by month on created_at
+
+Revision ID: f2b84a0d51c9
+Revises: e7a530c64d18
+Create Date: 2026-08-28 11:35:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'f2b84a0d51c9'
+down_revision = 'e7a530c64d18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # Monthly partitions make retention a DROP TABLE (O(1) metadata op)
+    # instead of a row-by-row DELETE, and give days_back queries automatic
+    # partition pruning. The partition key must be part of the primary key.
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+    op.execute(
+        "CREATE TABLE audit_logs "
+        "(LIKE audit_logs_unpartitioned INCLUDING DEFAULTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs "
+        "ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, created_at)"
+    )
+    op.execute(
+        "ALTER TABLE audit_logs "
+        "ADD CONSTRAINT audit_logs_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL"
+    )
+    # Indexes on the parent propagate to every partition.
+    op.execute("CREATE INDEX idx_audit_created_at ON audit_logs (created_at)")
+    op.execute("CREATE INDEX idx_audit_entity ON audit_logs (entity_type, entity_id)")
+    op.execute("CREATE INDEX idx_audit_user_action ON audit_logs (user_id, action)")
+    op.execute("CREATE INDEX idx_audit_user_created ON audit_logs (user_id, created_at)")
+    op.execute("CREATE INDEX ix_audit_logs_id ON audit_logs (id)")
+    op.execute("CREATE INDEX ix_audit_logs_user_id ON audit_logs (user_id)")
+
+    # Partition-maintenance function; schedule
+    # `SELECT ensure_audit_log_partitions(3)` monthly (cron/pg_partman).
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_audit_log_partitions(months_ahead int)
+        RETURNS void LANGUAGE plpgsql AS $$
+        DECLARE
+            month_start date := date_trunc('month', now())::date;
+            part_start date;
+            part_name text;
+        BEGIN
+            FOR offs IN 0..months_ahead LOOP
+                part_start := (month_start + (offs || ' months')::interval)::date;
+                part_name := 'audit_logs_' || to_char(part_start, 'YYYY_MM');
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    part_name, part_start, part_start + interval '1 month'
+                );
+            END LOOP;
+        END;
+        $$
+    """)
+
+    # Partitions for all existing months plus a few ahead, then move the
+    # old rows over. The default partition catches anything that falls
+    # outside maintained ranges.
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start date;
+            last_month date := date_trunc('month', now())::date;
+            part_name text;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(created_at), now()))::date
+            INTO month_start FROM audit_logs_unpartitioned;
+            WHILE month_start <= last_month LOOP
+                part_name := 'audit_logs_' || to_char(month_start, 'YYYY_MM');
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF audit_logs '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    part_name, month_start, month_start + interval '1 month'
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END;
+        $$
+    """)
+    op.execute("SELECT ensure_audit_log_partitions(3)")
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned")
+    op.execute("DROP TABLE audit_logs_unpartitioned")
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute(
+        "CREATE TABLE audit_logs (LIKE audit_logs_partitioned INCLUDING DEFAULTS)"
+    )
+    op.execute("ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id)")
+    op.execute(
+        "ALTER TABLE audit_logs "
+        "ADD CONSTRAINT audit_logs_user_id_fkey "
+        "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE SET NULL"
+    )
+    op.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_partitioned")
+    op.execute("DROP TABLE audit_logs_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS ensure_audit_log_partitions(int)")
+    op.execute("CREATE INDEX idx_audit_created_at ON audit_logs (created_at)")
+    op.execute("CREATE INDEX idx_audit_entity ON audit_logs (entity_type, entity_id)")
+    op.execute("CREATE INDEX idx_audit_user_action ON audit_logs (user_id, action)")
+    op.execute("CREATE INDEX idx_audit_user_created ON audit_logs (user_id, created_at)")
+    op.execute("CREATE INDEX ix_audit_logs_id ON audit_logs (id)")
+    op.execute("CREATE INDEX ix_audit_logs_user_id ON audit_logs (user_id)")
@@ -0,0 +1,35 @@
+"""Add native-UUID entity_uuid column to audit_logs
+
+Revision ID: f8c2d5a3e916
+Revises: e4a7f19c30d5
+Create Date: 2026-08-28 12:55:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# --- Revision identifiers ---
+revision = 'f8c2d5a3e916'
+down_revision = 'e4a7f19c30d5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database schema to this revision."""
+    # UUID entity keys previously went through str() into the 36-char
+    # entity_id text column; a native uuid column binds as 16 binary
+    # bytes. Applied on the partitioned parent, so all partitions
+    # inherit column and index.
+    op.execute("ALTER TABLE audit_logs ADD COLUMN IF NOT EXISTS entity_uuid uuid")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_entity_uuid "
+        "ON audit_logs (entity_uuid)"
+    )
+
+
+def downgrade():
+    """Downgrade database schema to the previous revision."""
+    op.execute("DROP INDEX IF EXISTS ix_audit_logs_entity_uuid")
+    op.execute("ALTER TABLE audit_logs DROP COLUMN IF EXISTS entity_uuid")
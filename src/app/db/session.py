@@ -1,10 +1,42 @@
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from src.app.config import settings
+from src.app.config import FROZEN_SETTINGS as settings
 
 DATABASE_URL = settings.DATABASE_URL
+# Ensure the async asyncpg driver is used even if the URL omits it.
+if DATABASE_URL.startswith("postgresql://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+# Sizing rule: pool_size + max_overflow must cover
+# uvicorn workers x concurrent in-flight requests per worker, or requests
+# queue on checkout and hit pool_timeout under load.
+POOL_SIZE = 20
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    pool_size=POOL_SIZE,
+    max_overflow=40,
+    pool_pre_ping=True,
+    # Recycle connections before typical idle-connection cutoffs
+    # (LBs/pgbouncer) can kill them under us.
+    pool_recycle=1800,
+    pool_timeout=2.0,
+    # SQLAlchemy-side compiled-statement cache: hot selects skip the
+    # Core-expression compile step (default is 500).
+    query_cache_size=1200,
+    # Batch executemany INSERTs into multi-VALUES statements of up to
+    # 1000 rows each (audit log flushes ride on this).
+    insertmanyvalues_page_size=1000,
+    connect_args={
+        # asyncpg-side prepared statement caching: repeated hot queries skip
+        # the parse/plan round-trip.
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+    },
+)
 
 AsyncSessionLocal = sessionmaker(
     bind=engine,
@@ -15,6 +47,17 @@ AsyncSessionLocal = sessionmaker(
 )
 
 
+async def prewarm_pool() -> None:
+    """Open and ping pool_size connections so early requests skip connect cost."""
+    conns = [await engine.connect() for _ in range(POOL_SIZE)]
+    try:
+        for conn in conns:
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in conns:
+            await conn.close()
+
+
 # Dependency for FastAPI
 async def get_async_session():
     async with AsyncSessionLocal() as session:
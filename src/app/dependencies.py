@@ -1,13 +1,21 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_async_session
+from app.core import request_cache
+from app.core.admission import db_admission
 from app.config import settings
 from typing import AsyncGenerator
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async for session in get_async_session():
-        yield session
+    # Fresh per-request lookup cache; repeated get_by_* calls within this
+    # request are served from it instead of re-querying.
+    request_cache.activate()
+    # Admission-controlled: when the DB slows down, queue here instead of
+    # piling onto an exhausted connection pool.
+    async with db_admission.slot():
+        async for session in get_async_session():
+            yield session
 
 
 def get_settings():
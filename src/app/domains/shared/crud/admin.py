@@ -67,14 +67,57 @@ class AdminCRUD:
         update_values = admin_data.model_dump(exclude_unset=True)
         update_values["updated_at"] = func.now()
 
-        await self.db.execute(
+        # RETURNING hands back the updated row in the same round-trip,
+        # replacing the post-commit re-fetch.
+        result = await self.db.execute(
             update(Admin)
             .where(Admin.id == admin_id)
             .values(**update_values)
+            .returning(Admin)
+            .execution_options(synchronize_session=False)
         )
+        updated_admin = result.scalar_one()
         await self.db.commit()
         logger.info("Updated admin %s", admin_id)
-        return await self.get_by_id(admin_id)
+        return updated_admin
+
+    @db_operation
+    async def update_if(self, admin_id: UUID, values: dict, predicate) -> Optional[Admin]:
+        """
+        Update an admin only where the predicate holds, returning the row.
+
+        Encoding the authorization predicate in the WHERE clause lets one
+        round-trip do the fetch-check-update the service used to spread
+        over two statements. Returns None when nothing matched.
+        """
+        values = dict(values)
+        values.setdefault("updated_at", func.now())
+        result = await self.db.execute(
+            update(Admin)
+            .where(Admin.id == admin_id, predicate)
+            .values(**values)
+            .returning(Admin)
+            .execution_options(synchronize_session=False)
+        )
+        updated_admin = result.scalar_one_or_none()
+        await self.db.commit()
+        if updated_admin is not None:
+            logger.info("Updated admin %s", admin_id)
+        return updated_admin
+
+    @db_operation
+    async def delete_if(self, admin_id: UUID, predicate) -> bool:
+        """Delete an admin only where the predicate holds; True if deleted."""
+        result = await self.db.execute(
+            delete(Admin)
+            .where(Admin.id == admin_id, predicate)
+            .returning(Admin.id)
+        )
+        deleted = result.scalar_one_or_none() is not None
+        await self.db.commit()
+        if deleted:
+            logger.info("Deleted admin %s", admin_id)
+        return deleted
 
     @db_operation
     async def delete(self, admin_id: UUID) -> bool:
@@ -94,22 +137,22 @@ class AdminCRUD:
         role: Optional[str] = None,
         search: Optional[str] = None,
         sort_by: str = "assigned_at",
-        sort_desc: bool = True
+        sort_desc: bool = True,
+        exclude_superadmin: bool = False
     ) -> Tuple[List[Admin], int]:
-        query = select(Admin)
-        count_query = select(func.count(Admin.id))
+        # Window-function count rides along with the page query, so rows and
+        # total come back in a single round-trip.
+        query = select(Admin, func.count().over().label("total_count"))
 
         if role:
             query = query.where(Admin.role == role)
-            count_query = count_query.where(Admin.role == role)
+
+        if exclude_superadmin:
+            query = query.where(Admin.role != "superadmin")
 
         if search:
             search_term = f"%{search.lower()}%"
             query = query.where(func.lower(Admin.notes).like(search_term))
-            count_query = count_query.where(func.lower(Admin.notes).like(search_term))
-
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
 
         sort_column = getattr(Admin, sort_by, Admin.assigned_at)
         if sort_desc:
@@ -119,7 +162,9 @@ class AdminCRUD:
 
         query = query.offset(skip).limit(limit)
         result = await self.db.execute(query)
-        admins = result.scalars().all()
+        rows = result.all()
+        admins = [row[0] for row in rows]
+        total = rows[0].total_count if rows else 0
 
         logger.info("Listed %d admins (total: %d)", len(admins), total)
         return admins, total
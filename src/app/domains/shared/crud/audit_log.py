@@ -1,8 +1,11 @@
+import asyncio
+import json
+import uuid
 from typing import Optional, List, Tuple, Dict, Any
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func, and_, desc
+from sqlalchemy import insert, select, func, and_, or_, desc, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -14,6 +17,97 @@ from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Batches at least this large go through PostgreSQL COPY instead of
+# multi-row INSERT; COPY does one permission/type check for the whole batch.
+COPY_THRESHOLD = 100
+
+
+class AuditLogBuffer:
+    """
+    Write-behind buffer for audit log entries.
+
+    Entries are enqueued from the request path and flushed to the DB in
+    batches by a background task, so requests no longer pay a
+    commit/fsync per audit record.
+    """
+
+    def __init__(self, max_batch: int = 500, flush_interval: float = 0.1, maxsize: int = 10_000):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, audit_data: AuditLogCreate) -> None:
+        """Queue an entry for background insertion; drops (with a log) when full."""
+        try:
+            self._queue.put_nowait(audit_data)
+        except asyncio.QueueFull:
+            logger.warning("Audit log buffer full; dropping entry %s", audit_data.action)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._drain_loop())
+
+    async def stop(self) -> None:
+        """Stop the drainer and flush anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # _collect_nowait caps at max_batch; keep collecting until the
+        # queue is drained so shutdown never silently drops the excess.
+        while True:
+            remaining = self._collect_nowait()
+            if not remaining:
+                break
+            await self._flush(remaining)
+
+    def _collect_nowait(self) -> List[AuditLogCreate]:
+        batch = []
+        while not self._queue.empty() and len(batch) < self.max_batch:
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _drain_loop(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                async with asyncio.timeout(self.flush_interval):
+                    while len(batch) < self.max_batch:
+                        batch.append(await self._queue.get())
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # Cancelled mid-collection (shutdown): flush what was
+                # already pulled off the queue before re-raising, or those
+                # entries vanish with the task. stop() drains the rest.
+                try:
+                    await self._flush(batch)
+                except Exception as e:
+                    logger.error("Audit log flush failed, %d entries lost: %s", len(batch), e)
+                raise
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.error("Audit log flush failed, %d entries lost: %s", len(batch), e)
+
+    async def _flush(self, batch: List[AuditLogCreate]) -> None:
+        from app.db.session import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as session:
+            crud = AuditLogCRUD(session)
+            if len(batch) >= COPY_THRESHOLD:
+                await crud.bulk_create(batch)
+            else:
+                await crud.create_many(batch)
+        logger.info("Flushed %d audit log entries", len(batch))
+
+
+audit_buffer = AuditLogBuffer()
+
 
 class AuditLogCRUD:
     """CRUD operations for AuditLog model."""
@@ -37,18 +131,108 @@ class AuditLogCRUD:
         if entity_type_filter:
             filters.append(AuditLog.entity_type == entity_type_filter)
         if days_back is not None:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+            # Aware datetimes bind as timestamptz, so the created_at
+            # comparison stays implicit-cast-free and index-friendly.
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
             filters.append(AuditLog.created_at >= cutoff_date)
         return filters
 
-    async def create(self, audit_data: AuditLogCreate) -> AuditLog:
-        """Create new audit log entry."""
+    @staticmethod
+    def _keyset_condition(before: Optional[datetime], last_id: Optional[UUID]):
+        """
+        Cursor condition for keyset pagination: rows strictly after the
+        (created_at, id) position of the last row on the previous page.
+        """
+        if before is None:
+            return None
+        if last_id is None:
+            return AuditLog.created_at < before
+        return or_(
+            AuditLog.created_at < before,
+            and_(AuditLog.created_at == before, AuditLog.id < last_id),
+        )
+
+    async def create(self, audit_data: AuditLogCreate) -> None:
+        """Queue an audit log entry for batched background insertion."""
+        audit_buffer.enqueue(audit_data)
+
+    async def create_many(self, entries: List[AuditLogCreate]) -> int:
+        """
+        Insert audit entries in one round-trip.
+
+        The engine's insertmanyvalues_page_size groups the dicts into
+        multi-VALUES statements of up to 1000 rows each.
+        """
+        if not entries:
+            return 0
+        rows = [
+            {
+                "user_id": e.user_id,
+                "action": e.action,
+                "entity_type": e.entity_type,
+                "entity_id": e.entity_id,
+                "entity_uuid": e.entity_uuid,
+                "ip_address": e.ip_address,
+                "user_agent": e.user_agent,
+                "details": e.details,
+            }
+            for e in entries
+        ]
+        try:
+            await self.db.execute(insert(AuditLog), rows)
+            await self.db.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error("Batched audit log insert failed: %s", e)
+            raise DatabaseError(f"Batched audit log insert failed: {str(e)}") from e
+
+    async def bulk_create(self, entries: List[AuditLogCreate]) -> int:
+        """Bulk-insert audit entries via PostgreSQL COPY (fastest ingest path)."""
+        records = [
+            (
+                uuid.uuid4(),
+                e.user_id,
+                e.action,
+                e.entity_type,
+                e.entity_id,
+                e.entity_uuid,
+                e.ip_address,
+                e.user_agent,
+                json.dumps(e.details) if e.details is not None else None,
+                True,
+            )
+            for e in entries
+        ]
+        try:
+            conn = await self.db.connection()
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                "audit_logs",
+                records=records,
+                columns=[
+                    "id", "user_id", "action", "entity_type", "entity_id",
+                    "entity_uuid", "ip_address", "user_agent", "details",
+                    "is_active",
+                ],
+            )
+            await self.db.commit()
+            logger.info("Bulk-created %d audit log entries via COPY", len(records))
+            return len(records)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error("Bulk audit log creation failed: %s", e)
+            raise DatabaseError(f"Bulk audit log creation failed: {str(e)}") from e
+
+    async def create_immediate(self, audit_data: AuditLogCreate) -> AuditLog:
+        """Create an audit log entry synchronously, bypassing the buffer."""
         try:
             db_audit = AuditLog(
                 user_id=audit_data.user_id,
                 action=audit_data.action,
                 entity_type=audit_data.entity_type,
                 entity_id=audit_data.entity_id,
+                entity_uuid=audit_data.entity_uuid,
                 ip_address=audit_data.ip_address,
                 user_agent=audit_data.user_agent,
                 details=audit_data.details,
@@ -70,13 +254,21 @@ class AuditLogCRUD:
         self,
         user_id: UUID,
         *,
-        skip: int = 0,
+        before: Optional[datetime] = None,
+        last_id: Optional[UUID] = None,
         limit: int = 100,
         action_filter: Optional[str] = None,
         entity_type_filter: Optional[str] = None,
         days_back: Optional[int] = None,
     ) -> Tuple[List[AuditLog], int]:
-        """Get audit logs for a specific user with filtering."""
+        """
+        Get audit logs for a specific user with filtering.
+
+        Pagination is keyset-based: pass the last row's created_at/id as
+        before/last_id to fetch the next page. Unlike OFFSET, the cursor
+        seeks directly into the (user_id, created_at) index, so deep pages
+        cost the same as the first.
+        """
         try:
             filters = self._build_filters(
                 action_filter=action_filter,
@@ -84,17 +276,23 @@ class AuditLogCRUD:
                 user_id_filter=user_id,
                 days_back=days_back,
             )
+            cursor = self._keyset_condition(before, last_id)
+            if cursor is not None:
+                filters.append(cursor)
             filter_condition = and_(*filters) if filters else True
 
-            query = select(AuditLog).where(filter_condition)
-            count_query = select(func.count(AuditLog.id)).where(filter_condition)
-
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
-
-            query = query.order_by(desc(AuditLog.created_at)).offset(skip).limit(limit)
+            # Window-function count rides along with the page query, so rows
+            # and total come back in a single round-trip.
+            query = (
+                select(AuditLog, func.count().over().label("total_count"))
+                .where(filter_condition)
+                .order_by(desc(AuditLog.created_at), desc(AuditLog.id))
+                .limit(limit)
+            )
             result = await self.db.execute(query)
-            logs = result.scalars().all()
+            rows = result.all()
+            logs = [row[0] for row in rows]
+            total = rows[0].total_count if rows else 0
 
             logger.info("Retrieved %d audit logs for user %s", len(logs), user_id)
             return logs, total
@@ -106,14 +304,19 @@ class AuditLogCRUD:
     async def get_system_logs(
         self,
         *,
-        skip: int = 0,
+        before: Optional[datetime] = None,
+        last_id: Optional[UUID] = None,
         limit: int = 100,
         action_filter: Optional[str] = None,
         entity_type_filter: Optional[str] = None,
         user_id_filter: Optional[UUID] = None,
         days_back: Optional[int] = None,
     ) -> Tuple[List[AuditLog], int]:
-        """Get system-wide audit logs with filtering."""
+        """
+        Get system-wide audit logs with filtering.
+
+        Paginated by keyset cursor (before/last_id); see get_user_logs.
+        """
         try:
             filters = self._build_filters(
                 action_filter=action_filter,
@@ -121,17 +324,23 @@ class AuditLogCRUD:
                 user_id_filter=user_id_filter,
                 days_back=days_back,
             )
+            cursor = self._keyset_condition(before, last_id)
+            if cursor is not None:
+                filters.append(cursor)
             filter_condition = and_(*filters) if filters else True
 
-            query = select(AuditLog).options(selectinload(AuditLog.user)).where(filter_condition)
-            count_query = select(func.count(AuditLog.id)).where(filter_condition)
-
-            total_result = await self.db.execute(count_query)
-            total = total_result.scalar() or 0
-
-            query = query.order_by(desc(AuditLog.created_at)).offset(skip).limit(limit)
+            # Same single-round-trip pattern as get_user_logs.
+            query = (
+                select(AuditLog, func.count().over().label("total_count"))
+                .options(selectinload(AuditLog.user))
+                .where(filter_condition)
+                .order_by(desc(AuditLog.created_at), desc(AuditLog.id))
+                .limit(limit)
+            )
             result = await self.db.execute(query)
-            logs = result.scalars().all()
+            rows = result.all()
+            logs = [row[0] for row in rows]
+            total = rows[0].total_count if rows else 0
 
             logger.info("Retrieved %d system audit logs", len(logs))
             return logs, total
@@ -147,7 +356,9 @@ class AuditLogCRUD:
     ) -> Dict[str, int]:
         """Get summary of actions performed within specified timeframe."""
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+            # Aware datetimes bind as timestamptz, so the created_at
+            # comparison stays implicit-cast-free and index-friendly.
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
             query = (
                 select(
@@ -172,18 +383,56 @@ class AuditLogCRUD:
             raise DatabaseError(f"Action summary generation failed: {str(e)}") from e
 
     async def cleanup_old_logs(self, days_to_keep: int = 90) -> int:
-        """Remove audit logs older than specified days."""
+        """
+        Remove audit logs older than specified days.
+
+        audit_logs is range-partitioned by month, so retention drops whole
+        monthly partitions — a metadata operation — rather than running a
+        row-by-row DELETE. Months that only partially exceed the cutoff are
+        kept until they expire entirely.
+        """
         try:
-            cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
+            cutoff_month = cutoff_date.strftime("%Y_%m")
 
             result = await self.db.execute(
-                AuditLog.__table__.delete().where(AuditLog.created_at < cutoff_date)
+                text(
+                    "SELECT c.relname FROM pg_inherits i "
+                    "JOIN pg_class c ON c.oid = i.inhrelid "
+                    "JOIN pg_class p ON p.oid = i.inhparent "
+                    "WHERE p.relname = 'audit_logs' "
+                    "AND c.relname ~ '^audit_logs_[0-9]{4}_[0-9]{2}$'"
+                )
             )
+            deleted_count = 0
+            for (part_name,) in result:
+                # Zero-padded YYYY_MM suffixes compare chronologically.
+                if part_name[len("audit_logs_"):] < cutoff_month:
+                    count_result = await self.db.execute(
+                        text(f'SELECT count(*) FROM "{part_name}"')
+                    )
+                    deleted_count += count_result.scalar() or 0
+                    await self.db.execute(text(f'DROP TABLE "{part_name}"'))
             await self.db.commit()
 
-            deleted_count = result.rowcount or 0
-            logger.info("Cleaned up %d old audit log entries", deleted_count)
+            # Stray rows land in the default partition; sweep those in
+            # bounded batches, committing between each, so the delete never
+            # holds long locks or bloats WAL under concurrent writes.
+            while True:
+                batch_result = await self.db.execute(
+                    text(
+                        "DELETE FROM audit_logs_default WHERE ctid IN ("
+                        "SELECT ctid FROM audit_logs_default "
+                        "WHERE created_at < :cutoff LIMIT 10000)"
+                    ),
+                    {"cutoff": cutoff_date},
+                )
+                await self.db.commit()
+                if not batch_result.rowcount:
+                    break
+                deleted_count += batch_result.rowcount
 
+            logger.info("Cleaned up %d old audit log entries", deleted_count)
             return deleted_count
 
         except SQLAlchemyError as e:
@@ -1,8 +1,9 @@
-from typing import Optional, List, Tuple
+from typing import AsyncIterator, Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from sqlalchemy import select, update, delete, func, and_, or_, desc
+from sqlalchemy import select, update, delete, func, and_, or_, desc, bindparam, lambda_stmt, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -12,10 +13,26 @@ from app.domains.shared.models.user import User
 from app.domains.shared.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
 from app.core.exceptions import DatabaseError, ConflictError, NotFoundError
+from app.core import request_cache
 from app.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Hoisted login statement: built and compiled once, executed with bound
+# parameters per call, so the statement cache hits on every login. Only
+# the columns the hash check needs come back — failed logins (the common
+# case under credential stuffing) never pull the full row off the wire.
+_AUTH_STMT = lambda_stmt(
+    lambda: select(User.id, User.password, User.is_active)
+    .where(
+        or_(
+            func.lower(User.username) == bindparam("ident"),
+            func.lower(User.email) == bindparam("ident"),
+        )
+    )
+    .limit(1)
+)
+
 
 def db_operation(func):
     async def wrapper(self, *args, **kwargs):
@@ -36,10 +53,11 @@ class UserCRUD:
 
     def _get_relationship_options(self):
         """Helper method for relationship loading."""
+        # audit_logs is deliberately not eager-loaded: it is unbounded for
+        # active users; use AuditLogCRUD.get_user_logs for paginated history.
         return [
             selectinload(User.student_profile),
             selectinload(User.admin_profile),
-            selectinload(User.audit_logs),
         ]
 
     async def _execute_query(self, query: Select) -> Optional[User]:
@@ -60,25 +78,35 @@ class UserCRUD:
             logger.error("List query execution failed: %s", e)
             raise DatabaseError(f"Database operation failed: {str(e)}")
 
+    @request_cache.cached_lookup
     async def get_by_id(
         self,
         user_id: UUID,
         include_relationships: bool = False
     ) -> Optional[User]:
         """Retrieve user by ID."""
-        query = select(User).where(User.id == user_id)
-
         if include_relationships:
-            query = query.options(*self._get_relationship_options())
+            query = (
+                select(User)
+                .where(User.id == user_id)
+                .options(*self._get_relationship_options())
+            )
+            return await self._execute_query(query)
 
-        return await self._execute_query(query)
+        # lambda_stmt caches the compiled statement across calls; only the
+        # bound user_id changes per invocation.
+        return await self._execute_query(
+            lambda_stmt(lambda: select(User).where(User.id == user_id))
+        )
 
+    @request_cache.cached_lookup
     async def get_by_email(self, email: str) -> Optional[User]:
         """Case-insensitive email search."""
         return await self._execute_query(
             select(User).where(func.lower(User.email) == email.lower())
         )
 
+    @request_cache.cached_lookup
     async def get_by_username(self, username: str) -> Optional[User]:
         """Exact username match."""
         return await self._execute_query(
@@ -100,20 +128,36 @@ class UserCRUD:
         exclude_user_id: Optional[UUID] = None
     ) -> None:
         """Raise ConflictError if email/username/phone_number is already used by another user."""
-        checks = [
-            ("Email", email, func.lower(User.email) == email.lower() if email else None),
-            ("Username", username, func.lower(User.username) == username.lower() if username else None),
-            ("Phone number", phone_number, User.phone_number == phone_number if phone_number else None),
-        ]
+        conditions = []
+        if email:
+            conditions.append(func.lower(User.email) == email.lower())
+        if username:
+            conditions.append(func.lower(User.username) == username.lower())
+        if phone_number:
+            conditions.append(User.phone_number == phone_number)
+        if not conditions:
+            return
+
+        # One OR'd query instead of up to three sequential round-trips; the
+        # returned columns tell us which field conflicted.
+        query = select(User.email, User.username, User.phone_number).where(or_(*conditions))
+        if exclude_user_id:
+            query = query.where(User.id != exclude_user_id)
 
-        for field_name, value, condition in checks:
-            if value and condition is not None:
-                query = select(User).where(condition)
-                if exclude_user_id:
-                    query = query.where(User.id != exclude_user_id)
-                existing = await self._execute_query(query)
-                if existing:
-                    raise ConflictError(f"{field_name} already registered")
+        try:
+            result = await self.db.execute(query.limit(1))
+            row = result.first()
+        except SQLAlchemyError as e:
+            logger.error("Uniqueness check failed: %s", e)
+            raise DatabaseError(f"Database operation failed: {str(e)}")
+
+        if row is None:
+            return
+        if email and row.email and row.email.lower() == email.lower():
+            raise ConflictError("Email already registered")
+        if username and row.username and row.username.lower() == username.lower():
+            raise ConflictError("Username already registered")
+        raise ConflictError("Phone number already registered")
 
     def _normalize_user_input(self, data: dict) -> dict:
         if 'email' in data and data['email']:
@@ -126,28 +170,40 @@ class UserCRUD:
 
     @db_operation
     async def create(self, user_data: UserCreate) -> User:
-        """Create new user with conflict checks."""
-        await self._check_uniqueness(
-            email=user_data.email,
-            username=user_data.username,
-            phone_number=user_data.phone_number,
-        )
-
-        db_user = User(
-            username=user_data.username.lower(),
-            email=user_data.email.lower(),
-            password=get_password_hash(user_data.password),
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            phone_number=user_data.phone_number,
-            profile_image_url=str(user_data.profile_image_url) if user_data.profile_image_url else None,
-            is_active=True,
-            email_verified=False,
+        """Create new user, relying on unique constraints for conflicts."""
+        # ON CONFLICT DO NOTHING ... RETURNING inserts and reads back the
+        # row in one round-trip and closes the check-then-insert race the
+        # old pre-flight uniqueness SELECT left open.
+        stmt = (
+            pg_insert(User)
+            .values(
+                username=user_data.username.lower(),
+                email=user_data.email.lower(),
+                password=await get_password_hash(user_data.password),
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+                phone_number=user_data.phone_number,
+                profile_image_url=str(user_data.profile_image_url) if user_data.profile_image_url else None,
+                is_active=True,
+                email_verified=False,
+            )
+            .on_conflict_do_nothing()
+            .returning(User)
         )
+        result = await self.db.execute(stmt)
+        db_user = result.scalar_one_or_none()
+        if db_user is None:
+            # A unique constraint fired; re-query to report which field.
+            await self.db.rollback()
+            await self._check_uniqueness(
+                email=user_data.email,
+                username=user_data.username,
+                phone_number=user_data.phone_number,
+            )
+            raise ConflictError("User already registered")
 
-        self.db.add(db_user)
         await self.db.commit()
-        await self.db.refresh(db_user)
+        request_cache.invalidate()
         logger.info("Created user %s", db_user.username)
         return db_user
 
@@ -169,19 +225,25 @@ class UserCRUD:
         )
 
         if "password" in update_values:
-            update_values["password"] = get_password_hash(update_values["password"])
+            update_values["password"] = await get_password_hash(update_values["password"])
 
         update_values["updated_at"] = func.now()
 
-        await self.db.execute(
+        # RETURNING hands back the updated row in the same round-trip,
+        # replacing the post-commit re-fetch.
+        result = await self.db.execute(
             update(User)
             .where(User.id == user_id)
             .values(**update_values)
+            .returning(User)
+            .execution_options(synchronize_session=False)
         )
+        updated_user = result.scalar_one()
         await self.db.commit()
+        request_cache.invalidate()
 
         logger.info("Updated user %s", user_id)
-        return await self.get_by_id(user_id)  # type: ignore
+        return updated_user
 
     @db_operation
     async def delete(self, user_id: UUID) -> bool:
@@ -190,36 +252,52 @@ class UserCRUD:
             delete(User).where(User.id == user_id)
         )
         await self.db.commit()
+        request_cache.invalidate()
         if result.rowcount > 0:
             logger.info("Deleted user %s", user_id)
         return result.rowcount > 0
 
     @db_operation
     async def authenticate(self, identifier: str, password: str) -> Optional[User]:
-        """Authenticate user by username/email and password."""
-        user = await self.get_by_username(identifier) or await self.get_by_email(identifier)
-
-        if not user or not user.is_active:
+        """Authenticate user by a pre-normalized username/email and password."""
+        # One precompiled query covers both identifier kinds instead of a
+        # sequential username-then-email fallback. Callers pass the
+        # identifier already lowercased (UserLogin normalizes it once).
+        result = await self.db.execute(_AUTH_STMT, {"ident": identifier})
+        row = result.first()
+
+        if row is None or not row.is_active:
             logger.warning("Authentication failed: user not found or inactive for %s", identifier)
             return None
 
-        if not verify_password(password, user.password):
+        if not await verify_password(password, row.password):
             logger.warning("Authentication failed: invalid password for %s", identifier)
             return None
 
+        # Load the full row only after the hash matched; session.get goes
+        # through the identity map and a single primary-key lookup.
+        user = await self.db.get(User, row.id)
+
         logger.info("User %s authenticated successfully", identifier)
         return user
 
     @db_operation
-    async def update_last_login(self, user_id: UUID) -> None:
-        """Update last login timestamp efficiently."""
-        await self.db.execute(
-            update(User)
-            .where(User.id == user_id)
-            .values(last_login=func.now())
+    async def update_last_login(self, user_id: UUID) -> Optional[datetime]:
+        """Update last login timestamp efficiently, returning the new value."""
+        # Pre-written SQL: this runs on every login, so skip Core
+        # expression construction and compilation entirely. RETURNING gives
+        # callers the fresh timestamp without a follow-up refresh.
+        result = await self.db.execute(
+            text(
+                "UPDATE users SET last_login = now() "
+                "WHERE id = :id RETURNING last_login"
+            ),
+            {"id": user_id},
         )
+        last_login = result.scalar_one_or_none()
         await self.db.commit()
         logger.info("Updated last login for user %s", user_id)
+        return last_login
 
     @db_operation
     async def change_password(self, user_id: UUID, current_password: str, new_password: str) -> bool:
@@ -228,11 +306,11 @@ class UserCRUD:
         if not user:
             raise NotFoundError("User not found")
 
-        if not verify_password(current_password, user.password):
+        if not await verify_password(current_password, user.password):
             logger.warning("Password change failed: invalid current password for user %s", user_id)
             return False
 
-        new_password_hash = get_password_hash(new_password)
+        new_password_hash = await get_password_hash(new_password)
 
         await self.db.execute(
             update(User)
@@ -240,10 +318,30 @@ class UserCRUD:
             .values(password=new_password_hash, updated_at=func.now())
         )
         await self.db.commit()
+        request_cache.invalidate()
 
         logger.info("Password changed successfully for user %s", user_id)
         return True
 
+    @staticmethod
+    def _list_filters(
+        is_active: Optional[bool],
+        email_verified: Optional[bool],
+        search: Optional[str],
+    ) -> list:
+        """Build the shared filter list for user listing/streaming."""
+        filters = []
+        if is_active is not None:
+            filters.append(User.is_active == is_active)
+        if email_verified is not None:
+            filters.append(User.email_verified == email_verified)
+        if search:
+            # One LIKE over the generated search_text column (backed by
+            # users_search_trgm) instead of OR'ing per-field patterns the
+            # planner may not combine.
+            filters.append(User.search_text.like(f"%{search.lower()}%"))
+        return filters
+
     @db_operation
     async def list_users(
         self,
@@ -257,32 +355,14 @@ class UserCRUD:
         sort_desc: bool = True
     ) -> Tuple[List[User], int]:
         """List users with pagination, filtering, and search."""
-        query = select(User)
-        count_query = select(func.count(User.id))
-
-        filters = []
-        if is_active is not None:
-            filters.append(User.is_active == is_active)
-        if email_verified is not None:
-            filters.append(User.email_verified == email_verified)
-
-        if search:
-            search_term = f"%{search.lower()}%"
-            filters.append(
-                or_(
-                    func.lower(User.username).contains(search_term),
-                    func.lower(User.email).contains(search_term),
-                    User.phone_number.contains(search) if search.replace('+', '').replace('-', '').replace(' ', '').isdigit() else False
-                )
-            )
+        # Window-function count rides along with the page query, so rows and
+        # total come back in a single round-trip.
+        query = select(User, func.count().over().label("total_count"))
 
+        filters = self._list_filters(is_active, email_verified, search)
         if filters:
             filter_condition = and_(*filters)
             query = query.where(filter_condition)
-            count_query = count_query.where(filter_condition)
-
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar()
 
         sort_column = getattr(User, sort_by, User.created_at)
         if sort_desc:
@@ -292,11 +372,44 @@ class UserCRUD:
 
         query = query.offset(skip).limit(limit)
 
-        users = await self._execute_list_query(query)
+        result = await self.db.execute(query)
+        rows = result.all()
+        users = [row[0] for row in rows]
+        total = rows[0].total_count if rows else 0
 
         logger.info("Listed %d users (total: %d)", len(users), total)
         return users, total
 
+    async def stream_users(
+        self,
+        *,
+        is_active: Optional[bool] = None,
+        email_verified: Optional[bool] = None,
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True,
+        batch_size: int = 100,
+    ) -> AsyncIterator[User]:
+        """Stream matching users as the driver fetches them.
+
+        yield_per keeps at most batch_size rows buffered instead of
+        materializing the whole result set, so unbounded exports stay
+        flat in memory.
+        """
+        query = select(User)
+        filters = self._list_filters(is_active, email_verified, search)
+        if filters:
+            query = query.where(and_(*filters))
+
+        sort_column = getattr(User, sort_by, User.created_at)
+        query = query.order_by(desc(sort_column) if sort_desc else sort_column)
+
+        result = await self.db.stream_scalars(
+            query.execution_options(yield_per=batch_size)
+        )
+        async for user in result:
+            yield user
+
     @db_operation
     async def soft_delete(self, user_id: UUID) -> bool:
         """Soft delete user by setting is_active to False."""
@@ -306,6 +419,7 @@ class UserCRUD:
             .values(is_active=False)
         )
         await self.db.commit()
+        request_cache.invalidate()
         if result.rowcount > 0:
             logger.info("Soft deleted user %s", user_id)
         return result.rowcount > 0
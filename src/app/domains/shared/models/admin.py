@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from typing import Optional
 from datetime import datetime, timezone
@@ -27,6 +27,13 @@ class Admin(DomainBase):
     __table_args__ = (
         Index('idx_admin_user_id_active', 'user_id', 'is_active'),
         Index('idx_admin_assigned_at', 'assigned_at'),
+        # Trigram GIN index so notes search uses an index scan instead of a
+        # sequential scan (requires the pg_trgm extension).
+        Index(
+            'idx_admin_notes_trgm',
+            text('lower(notes) gin_trgm_ops'),
+            postgresql_using='gin',
+        ),
     )
 
     def __repr__(self) -> str:
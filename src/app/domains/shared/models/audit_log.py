@@ -17,6 +17,9 @@ class AuditLog(DomainBase):
     action: Mapped[str] = mapped_column(String(50), nullable=False)
     entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
     entity_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)
+    # Native-UUID variant of entity_id: binds as 16 binary bytes and spares
+    # callers the str() conversion when the entity key is a UUID.
+    entity_uuid: Mapped[Optional[UUID]] = mapped_column(UUID(as_uuid=True), nullable=True, index=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
     details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
@@ -29,6 +32,14 @@ class AuditLog(DomainBase):
         Index('idx_audit_entity', 'entity_type', 'entity_id'),
         Index('idx_audit_created_at', 'created_at'),
         Index('idx_audit_user_created', 'user_id', 'created_at'),
+        # jsonb_path_ops GIN: smaller than the default opclass and covers
+        # the @> containment queries used for log search.
+        Index(
+            'idx_audit_details_gin',
+            'details',
+            postgresql_using='gin',
+            postgresql_ops={'details': 'jsonb_path_ops'},
+        ),
     )
 
     def __repr__(self) -> str:
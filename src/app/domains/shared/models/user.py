@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Boolean, DateTime, Index
+from sqlalchemy import String, Boolean, Computed, DateTime, Index, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from typing import Optional, List, TYPE_CHECKING
 from app.domains.shared.models.base import DomainBase
@@ -22,18 +22,83 @@ class User(DomainBase):
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
     last_login: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False)
-    phone_number: Mapped[Optional[str]] = mapped_column(String(20), unique=True, index=True, nullable=True)
+    # Uniqueness enforced by the partial index below; a full unique index
+    # would carry an entry per NULL for a mostly-empty column.
+    phone_number: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     profile_image_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Generated column concatenating the searchable fields; one trigram
+    # index over it serves cross-field search in list_users.
+    search_text: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed(
+            "lower(username) || ' ' || lower(email) || ' ' || coalesce(phone_number, '')",
+            persisted=True,
+        ),
+        nullable=True,
+    )
 
-    # Relationships
-    audit_logs: Mapped[List["AuditLog"]] = relationship("AuditLog", back_populates="user", cascade="all, delete-orphan")
-    password_resets: Mapped[List["PasswordReset"]] = relationship("PasswordReset", back_populates="user", cascade="all, delete-orphan")
+    # Relationships. passive_deletes leaves child rows to the database FK
+    # actions on user delete (SET NULL keeps audit_logs with the user_id
+    # cleared; password_resets cascade away) instead of the ORM loading
+    # each collection just to emit per-row updates.
+    audit_logs: Mapped[List["AuditLog"]] = relationship("AuditLog", back_populates="user", cascade="save-update, merge", passive_deletes=True)
+    password_resets: Mapped[List["PasswordReset"]] = relationship("PasswordReset", back_populates="user", cascade="save-update, merge", passive_deletes=True)
 
     __table_args__ = (
-        Index('idx_user_email_active', 'email', 'is_active'),
-        Index('idx_user_username_active', 'username', 'is_active'),
+        # The auth lookup filters on lower(email)/lower(username) only,
+        # which the unique functional indexes (idx_users_*_lower, created
+        # in migration e7a530c64d18) serve; the old (col, is_active)
+        # composites were dropped as pure write amplification.
         Index('idx_user_created_at', 'created_at'),
+        Index(
+            'uq_user_phone_not_null',
+            'phone_number',
+            unique=True,
+            postgresql_where=text('phone_number IS NOT NULL'),
+        ),
+        # Partial indexes matching the common list filters: tiny (inactive
+        # rows excluded) and pre-sorted in the listing order.
+        Index(
+            'idx_users_active_created',
+            text('created_at DESC'),
+            postgresql_where=text('is_active'),
+        ),
+        Index(
+            'idx_users_active_verified_created',
+            text('created_at DESC'),
+            postgresql_where=text('is_active AND email_verified'),
+        ),
         Index('idx_user_last_login', 'last_login'),
+        # Trigram GIN indexes so unanchored LIKE search uses an index scan
+        # instead of a sequential scan (requires the pg_trgm extension).
+        Index(
+            'idx_users_username_trgm',
+            text('lower(username) gin_trgm_ops'),
+            postgresql_using='gin',
+        ),
+        Index(
+            'idx_users_email_trgm',
+            text('lower(email) gin_trgm_ops'),
+            postgresql_using='gin',
+        ),
+        # Functional btree indexes backing the lower(col) = lower(:v)
+        # lookups used on every login and uniqueness check.
+        Index('idx_users_email_lower', text('lower(email)'), unique=True),
+        Index('idx_users_username_lower', text('lower(username)'), unique=True),
+        # Single trigram index over the generated search_text column; the
+        # planner picks one index regardless of which field matches.
+        Index(
+            'users_search_trgm',
+            'search_text',
+            postgresql_using='gin',
+            postgresql_ops={'search_text': 'gin_trgm_ops'},
+        ),
+        # text_pattern_ops variant for future prefix LIKE searches.
+        Index(
+            'idx_users_email_pattern',
+            'email',
+            postgresql_ops={'email': 'text_pattern_ops'},
+        ),
     )
 
     def is_authenticated(self) -> bool:
@@ -43,5 +108,9 @@ class User(DomainBase):
         return self.is_active and self.email_verified
 
     def __repr__(self) -> str:
-        username_display = self.username[:10] + '...' if len(self.username) > 10 else self.username
-        return f"<User(id={self.id}, username={username_display})>"
+        # Slice only when actually needed; repr runs on every echoed
+        # statement and identity-map message under debug logging.
+        username = self.username
+        if len(username) > 10:
+            username = username[:10] + '...'
+        return f"<User(id={self.id}, username={username})>"
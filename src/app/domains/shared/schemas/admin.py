@@ -1,30 +1,26 @@
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from typing import Annotated, Optional, List
 from uuid import UUID
 from datetime import datetime
 from app.utils.validators import validate_role, validate_permissions_list
+from app.config import settings
+
+# Validators attached via Annotated run inside pydantic-core's fused
+# chain, replacing one decorated classmethod frame per field per model.
+AdminRole = Annotated[str, AfterValidator(validate_role)]
+Permissions = Annotated[Optional[List[str]], AfterValidator(validate_permissions_list)]
 
 
 class AdminBase(BaseModel):
     """Base admin schema with common fields."""
-    role: str = Field(..., description="Role of the admin, e.g., 'admin' or 'superadmin'")
-    permissions: Optional[List[str]] = Field(
+    role: AdminRole = Field(..., description="Role of the admin, e.g., 'admin' or 'superadmin'")
+    permissions: Permissions = Field(
         None, description="List of permissions"
     )
     notes: Optional[str] = Field(
         None, description="Internal notes about the admin", max_length=255
     )
 
-    @field_validator('role')
-    @classmethod
-    def validate_role_field(cls, v):
-        return validate_role(v)
-
-    @field_validator('permissions')
-    @classmethod
-    def validate_permissions_list_field(cls, v):
-        return validate_permissions_list(v)
-
 
 class AdminCreate(AdminBase):
     """Schema for creating a new admin."""
@@ -33,24 +29,12 @@ class AdminCreate(AdminBase):
 
 class AdminUpdate(BaseModel):
     """Schema for updating admin information."""
-    role: Optional[str] = Field(None, description="Role of the admin")
-    permissions: Optional[List[str]] = Field(None, description="List of permissions")
+    role: Optional[AdminRole] = Field(None, description="Role of the admin")
+    permissions: Permissions = Field(None, description="List of permissions")
     notes: Optional[str] = Field(None, description="Notes", max_length=255)
     is_active: Optional[bool] = None
     last_active_at: Optional[datetime] = None
 
-    @field_validator('role')
-    @classmethod
-    def validate_role_field(cls, v):
-        if v is not None:
-            return validate_role(v)
-        return v
-
-    @field_validator('permissions')
-    @classmethod
-    def validate_permissions_list_field(cls, v):
-        return validate_permissions_list(v)
-
 
 class AdminRead(AdminBase):
     """Schema for reading admin information."""
@@ -62,12 +46,22 @@ class AdminRead(AdminBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    # Built lazily on first validation; unknown attributes are skipped in
+    # the from_attributes path.
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj) -> "AdminRead":
+        """Build from a trusted ORM row, skipping field revalidation."""
+        if not settings.TRUST_DB_SCHEMA:
+            return cls.model_validate(obj)
+        return cls.model_construct(**{k: getattr(obj, k) for k in cls.model_fields})
 
 
 class AdminList(BaseModel):
     """Schema for paginated admin listing."""
+    model_config = ConfigDict(defer_build=True)
+
     admins: List[AdminRead]
     total: int
     page: int
@@ -1,5 +1,5 @@
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
@@ -10,6 +10,7 @@ class AuditLogBase(BaseModel):
     action: str = Field(..., max_length=50)
     entity_type: str = Field(..., max_length=50)
     entity_id: Optional[str] = Field(None, max_length=36)
+    entity_uuid: Optional[UUID] = None
     ip_address: Optional[str] = Field(None, max_length=45)
     user_agent: Optional[str] = Field(None, max_length=500)
     details: Optional[Dict[str, Any]] = None
@@ -25,12 +26,13 @@ class AuditLogRead(AuditLogBase):
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=True)
 
 
 class AuditLogList(BaseModel):
     """Schema for paginated audit log listing."""
+    model_config = ConfigDict(defer_build=True)
+
     logs: List[AuditLogRead]
     total: int
     page: int
@@ -1,125 +1,121 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator, HttpUrl
-from typing import Optional, List
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    EmailStr,
+    Field,
+    HttpUrl,
+    StringConstraints,
+    TypeAdapter,
+    model_validator,
+)
+from typing import Annotated, Optional, List
+from functools import lru_cache
 from uuid import UUID
 from datetime import datetime
+import re
 from app.utils.validators import (
-    validate_username,
-    validate_optional_password,
-    validate_optional_username,
+    validate_reserved_username,
     validate_phone_number,
     validate_name,
     empty_string_to_none
 )
 from app.core.password_policy import PasswordPolicy
+from app.core.sanitizer import sanitize_identifier
+from app.config import settings
 
 PHONE_NUMBER_REGEX = r"^\+?[1-9]\d{1,14}$"
 
 
-class UserBase(BaseModel):
-    """Base user schema with common fields."""
-    username: str = Field(..., min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
-    email: EmailStr = Field(..., max_length=100)
-    first_name: str = Field(..., min_length=1, max_length=50)
-    last_name: str = Field(..., min_length=1, max_length=50)
+USERNAME_REGEX = r"^[a-z0-9_]+$"
 
+_EMAIL_SHAPE_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
 
-class UserCreate(UserBase):
-    """Schema for creating a new user."""
-    password: str = Field(..., min_length=8, max_length=255)
-    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_REGEX)
-    profile_image_url: Optional[HttpUrl] = Field(None, max_length=255)
 
-    @field_validator('email')
-    @classmethod
-    def normalize_and_validate_email(cls, v):
-        if v is None:
-            return v
-        return v.lower()
+def _lower_str(v):
+    return v.lower() if isinstance(v, str) else v
 
-    @field_validator('password')
-    @classmethod
-    def password_strength(cls, v):
-        """Ensures password meets security requirements."""
-        return PasswordPolicy.validate(v)
 
-    @field_validator('username')
-    @classmethod
-    def normalize_and_validate_username(cls, v):
-        """Lowercases and validates the username."""
-        v = v.lower()
-        return validate_username(v)
+@lru_cache(maxsize=2048)
+def _full_email_check(v: str) -> str:
+    # email-validator's full parse (IDNA etc.) memoized per address;
+    # lru_cache does not cache raised errors, only accepted inputs.
+    return _EMAIL_ADAPTER.validate_python(v).lower()
 
-    @field_validator('first_name', 'last_name')
-    @classmethod
-    def name_format(cls, v):
-        return validate_name(v)
 
-    @field_validator('phone_number')
-    @classmethod
-    def phone_validation(cls, v):
-        """Validates E.164 phone number format when provided."""
-        if v is None:
-            return v
-        return validate_phone_number(v, strict=True)
+def _validate_email(v: str) -> str:
+    # One regex pass rejects obvious non-emails before the heavy parse.
+    if not _EMAIL_SHAPE_RE.match(v):
+        raise ValueError("Invalid email format")
+    return _full_email_check(v)
 
-    @field_validator('profile_image_url', mode='before')
-    @classmethod
-    def handle_empty_string(cls, v):
-        return empty_string_to_none(v)
 
+# Shared constrained-string aliases: each pattern= repeated inline makes
+# pydantic-core hold a separate compiled regex per field; one Annotated
+# alias dedupes the schema (and its automaton) across models.
+# Lowercase before the constraint check so the pattern (and any later
+# check) runs exactly once on the canonical form.
+Username = Annotated[str, StringConstraints(min_length=3, max_length=50, pattern=USERNAME_REGEX), BeforeValidator(_lower_str)]
+PhoneNumber = Annotated[str, StringConstraints(pattern=PHONE_NUMBER_REGEX)]
 
-class UserUpdate(BaseModel):
-    """Schema for updating user information."""
-    username: Optional[str] = Field(None, min_length=3, max_length=50, pattern=r"^[a-zA-Z0-9_]+$")
-    email: Optional[EmailStr] = Field(None, max_length=100)
-    first_name: Optional[str] = Field(None, min_length=1, max_length=50)
-    last_name: Optional[str] = Field(None, min_length=1, max_length=50)
-    password: Optional[str] = Field(None, min_length=8, max_length=255)
-    phone_number: Optional[str] = Field(None, pattern=PHONE_NUMBER_REGEX)
-    profile_image_url: Optional[HttpUrl] = Field(None, max_length=255)
-    is_active: Optional[bool] = None
-    email_verified: Optional[bool] = None
 
-    @field_validator('email')
-    @classmethod
-    def normalize_and_validate_email(cls, v):
-        if v is None:
-            return v
-        return v.lower()
+def _strict_phone(v: str) -> str:
+    return validate_phone_number(v, strict=True)
 
-    @field_validator('password')
-    @classmethod
-    def password_strength(cls, v):
-        """Conditional password validation when provided."""
-        return validate_optional_password(v)
 
-    @field_validator('username')
-    @classmethod
-    def normalize_and_validate_username(cls, v):
-        if v is None:
-            return v
-        v = v.lower()
-        return validate_optional_username(v)
+# Validators attached via Annotated run inside pydantic-core's fused
+# validation chain: one alias per rule instead of a decorated classmethod
+# (and its extra Python frame) per model.
+NormalizedEmail = Annotated[str, StringConstraints(max_length=100), AfterValidator(_validate_email)]
+NormalizedUsername = Annotated[Username, AfterValidator(validate_reserved_username)]
+Name = Annotated[str, StringConstraints(min_length=1, max_length=50), AfterValidator(validate_name)]
+StrictPhone = Annotated[PhoneNumber, AfterValidator(_strict_phone)]
+StrongPassword = Annotated[str, StringConstraints(min_length=8, max_length=255), AfterValidator(PasswordPolicy.validate)]
+ProfileImageUrl = Annotated[Optional[HttpUrl], BeforeValidator(empty_string_to_none)]
 
-    @field_validator('first_name', 'last_name')
-    @classmethod
-    def name_format_optional(cls, v):
-        if v is None:
-            return v
-        return validate_name(v)
 
-    @field_validator('phone_number')
-    @classmethod
-    def phone_validation(cls, v):
-        """Validates E.164 phone number format when provided."""
-        if v is None:
-            return v
-        return validate_phone_number(v, strict=True)
+class UserBase(BaseModel):
+    """Base user schema with common fields."""
+    username: Username
+    email: EmailStr = Field(..., max_length=100)
+    first_name: str = Field(..., min_length=1, max_length=50)
+    last_name: str = Field(..., min_length=1, max_length=50)
+
+
+class UserCreate(UserBase):
+    """Schema for creating a new user."""
+    username: NormalizedUsername
+    email: NormalizedEmail
+    first_name: Name
+    last_name: Name
+    password: StrongPassword
+    phone_number: Optional[StrictPhone] = None
+    profile_image_url: ProfileImageUrl = Field(None, max_length=255)
+
+
+class UserUpdate(BaseModel):
+    """Schema for updating user information."""
+    username: Optional[NormalizedUsername] = None
+    email: Optional[NormalizedEmail] = None
+    first_name: Optional[Name] = None
+    last_name: Optional[Name] = None
+    password: Optional[StrongPassword] = None
+    phone_number: Optional[StrictPhone] = None
+    profile_image_url: ProfileImageUrl = Field(None, max_length=255)
+    is_active: Optional[bool] = None
+    email_verified: Optional[bool] = None
 
     @model_validator(mode='after')
     def check_at_least_one_field(self):
-        """Ensures at least one field is provided for update."""
-        if not any(field is not None for field in self.model_dump().values()):
+        """Ensures at least one field carries a value for the update."""
+        # Walk model_fields_set (populated during validation) instead of
+        # serializing with model_dump(); the all() is vacuously true for
+        # an empty payload, so one check covers both "no fields" and
+        # "every set field is null" — either would reach the CRUD layer
+        # as an UPDATE that writes nothing or NULLs a NOT NULL column.
+        if all(getattr(self, f) is None for f in self.model_fields_set):
             raise ValueError("At least one field must be provided")
         return self
 
@@ -134,14 +130,27 @@ class UserRead(UserBase):
     last_login: Optional[datetime] = None
     email_verified: bool
     phone_number: Optional[str] = None
-    profile_image_url: Optional[HttpUrl] = Field(None, max_length=255)
+    # Plain str on the read path: the URL was validated as HttpUrl on
+    # write, so re-running the URL parser per serialized row (x page size
+    # on list endpoints) buys nothing.
+    profile_image_url: Optional[str] = None
+
+    # defer_build postpones core-schema construction to first use;
+    # extra='ignore' lets the from_attributes path skip unknown keys.
+    model_config = ConfigDict(from_attributes=True, extra='ignore', defer_build=True)
 
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_orm_fast(cls, obj) -> "UserRead":
+        """Build from a trusted ORM row, skipping field revalidation."""
+        if not settings.TRUST_DB_SCHEMA:
+            return cls.model_validate(obj)
+        return cls.model_construct(**{k: getattr(obj, k) for k in cls.model_fields})
 
 
 class UserList(BaseModel):
     """Schema for paginated user listing."""
+    model_config = ConfigDict(defer_build=True)
+
     users: List[UserRead]
     total: int
     page: int
@@ -152,22 +161,13 @@ class UserList(BaseModel):
 
 class UserLogin(BaseModel):
     """Schema for user login."""
-    identifier: str = Field(..., description="Username or email")
+    # Normalized once here; AuthService and the CRUD lookup use the value
+    # as-is without re-sanitizing or re-lowercasing.
+    identifier: Annotated[str, AfterValidator(sanitize_identifier)] = Field(..., description="Username or email")
     password: str = Field(..., min_length=1, max_length=255)
 
-    @field_validator('identifier')
-    @classmethod
-    def normalize_identifier(cls, v):
-        return v.lower()
-
 
 class UserPasswordChange(BaseModel):
     """Schema for changing user password."""
     current_password: str = Field(..., min_length=1, max_length=255)
-    new_password: str = Field(..., min_length=8, max_length=255)
-
-    @field_validator('new_password')
-    @classmethod
-    def password_strength(cls, v):
-        """Ensures new password meets security requirements."""
-        return PasswordPolicy.validate(v)
+    new_password: StrongPassword
@@ -1,5 +1,6 @@
 from uuid import UUID
 from typing import Optional, List, Tuple
+from sqlalchemy import or_
 from app.domains.shared.crud.admin import AdminCRUD
 from app.domains.shared.schemas.admin import AdminCreate, AdminUpdate, AdminRead
 from app.domains.shared.models.admin import Admin
@@ -20,16 +21,27 @@ class AdminService:
         return await self.admin_crud.create(admin_data)
 
     async def update_admin(self, admin_id: UUID, admin_data: AdminUpdate, acting_admin: Admin) -> Admin:
-        admin = await self.admin_crud.get_by_id(admin_id)
-        if not admin:
-            raise NotFoundError("Admin not found")
         # Only superadmins can update admins
         if not is_superadmin(acting_admin):
             raise PermissionError("Only superadmins can update admins.")
-        # Superadmins can only update themselves if target is superadmin
-        if admin.role == "superadmin" and acting_admin.id != admin.id:
-            raise PermissionError("Superadmins can only update themselves, not other superadmins.")
-        return await self.admin_crud.update(admin_id, admin_data)
+        # The target-is-superadmin rule rides in the WHERE clause, so the
+        # check and the update are one round-trip; only the failure path
+        # re-fetches to tell "missing" from "forbidden".
+        updated = await self.admin_crud.update_if(
+            admin_id,
+            admin_data.model_dump(exclude_unset=True),
+            self._may_touch(acting_admin),
+        )
+        if updated is None:
+            if await self.admin_crud.get_by_id(admin_id):
+                raise PermissionError("Superadmins can only update themselves, not other superadmins.")
+            raise NotFoundError("Admin not found")
+        return updated
+
+    @staticmethod
+    def _may_touch(acting_admin: Admin):
+        """Predicate: target is a regular admin, or the actor themself."""
+        return or_(Admin.role != "superadmin", Admin.id == acting_admin.id)
 
     async def get_admin(self, admin_id: UUID, acting_admin: Admin) -> Optional[Admin]:
         admin = await self.admin_crud.get_by_id(admin_id)
@@ -46,12 +58,12 @@ class AdminService:
     async def delete_admin(self, admin_id: UUID, acting_admin: Admin) -> bool:
         if not is_superadmin(acting_admin):
             raise PermissionError("Only superadmins can delete admins.")
-        admin = await self.admin_crud.get_by_id(admin_id)
-        if not admin:
+        deleted = await self.admin_crud.delete_if(admin_id, self._may_touch(acting_admin))
+        if not deleted:
+            if await self.admin_crud.get_by_id(admin_id):
+                raise PermissionError("Superadmins can only delete themselves.")
             raise NotFoundError("Admin not found")
-        if is_superadmin(admin) and acting_admin.id != admin.id:
-            raise PermissionError("Superadmins can only delete themselves.")
-        return await self.admin_crud.delete(admin_id)
+        return deleted
 
     async def list_admins(
         self,
@@ -63,15 +75,15 @@ class AdminService:
         sort_desc: bool = True,
         acting_admin: Optional[Admin] = None,
     ) -> Tuple[List[Admin], int]:
-        admins, total = await self.admin_crud.list(
+        # Filtering superadmins in SQL keeps pages full and the total
+        # accurate; the old Python post-filter returned short pages and
+        # reported the page length as the total.
+        return await self.admin_crud.list(
             skip=skip,
             limit=limit,
             role=role,
             search=search,
             sort_by=sort_by,
             sort_desc=sort_desc,
+            exclude_superadmin=bool(acting_admin) and not is_superadmin(acting_admin),
         )
-        if acting_admin and not is_superadmin(acting_admin):
-            admins = [a for a in admins if a.role != "superadmin"]
-            total = len(admins)
-        return admins, total
@@ -1,13 +1,12 @@
 from typing import Optional
 from uuid import UUID
+from sqlalchemy.orm.attributes import set_committed_value
 from app.domains.shared.crud.user import UserCRUD
-from app.domains.shared.crud.audit_log import AuditLogCRUD
+from app.domains.shared.crud.audit_log import AuditLogCRUD, audit_buffer
 from app.domains.shared.models.user import User
 from app.core.exceptions import AuthenticationError
 from app.domains.shared.schemas.audit_log import AuditLogCreate
-from app.core.sanitizer import sanitize_email, sanitize_username
 from app.utils.logging import get_logger
-from app.utils.date import utcnow
 
 logger = get_logger(__name__)
 
@@ -28,39 +27,40 @@ class AuthService:
     ) -> User:
         """Authenticate user and update last login."""
         try:
-            # Sanitize identifier
-            if "@" in identifier:
-                identifier = sanitize_email(identifier)
-            else:
-                identifier = sanitize_username(identifier)
-
+            # Identifier arrives normalized by UserLogin's validator, so no
+            # further sanitizing or kind-branching here.
             user = await self.user_crud.authenticate(identifier, password)
             if not user:
+                # model_construct: the values are already trusted and
+                # constant-shaped, so skip the validator walk per login.
                 await self.audit_crud.create(
-                    AuditLogCreate(
+                    AuditLogCreate.model_construct(
                         user_id=None,
                         action="LOGIN_FAILED",
                         entity_type="User",
                         ip_address=ip_address,
                         user_agent=user_agent,
                         details={"identifier": identifier},
-                        created_at=utcnow(),
                     )
                 )
                 raise AuthenticationError("Invalid credentials")
 
-            await self.user_crud.update_last_login(user.id)
-            await self.user_crud.db.refresh(user)
+            # The UPDATE returns the fresh timestamp, so no refresh query;
+            # set_committed_value updates the instance without dirtying it.
+            last_login = await self.user_crud.update_last_login(user.id)
+            if last_login is not None:
+                set_committed_value(user, "last_login", last_login)
 
-            await self.audit_crud.create(
-                AuditLogCreate(
+            # Enqueued, not awaited: the background buffer flushes it, so
+            # the login response no longer waits on the audit insert.
+            audit_buffer.enqueue(
+                AuditLogCreate.model_construct(
                     user_id=user.id,
                     action="LOGIN_SUCCESS",
-                    entity_id=str(user.id),
+                    entity_uuid=user.id,
                     entity_type="User",
                     ip_address=ip_address,
                     user_agent=user_agent,
-                    created_at=utcnow(),
                 )
             )
             logger.info("User authenticated successfully: %s", identifier)
@@ -1,12 +1,16 @@
 from typing import Optional, Dict, Any, Tuple
 from uuid import UUID
-from datetime import datetime
+import asyncio
+import hashlib
+import threading
+import time
 
 import jwt
 from jwt import ExpiredSignatureError, InvalidTokenError
+from cachetools import TTLCache
 
 from app.domains.shared.crud.user import UserCRUD
-from app.domains.shared.crud.audit_log import AuditLogCRUD
+from app.domains.shared.crud.audit_log import AuditLogCRUD, audit_buffer
 from app.domains.shared.schemas.user import UserCreate, UserUpdate, UserPasswordChange, UserRead
 from app.domains.shared.schemas.audit_log import AuditLogCreate
 from app.domains.shared.models.user import User
@@ -16,37 +20,87 @@ from app.core.permissions import is_superadmin
 from app.config import settings
 from app.utils.email import send_verification_email
 from app.utils.logging import get_logger
-from app.utils.date import utcnow, add_minutes
+from app.utils.date import utcnow
 from app.utils.cache import RedisCache
-import json
+import orjson
 
 from app.core.sanitizer import sanitize_email, sanitize_username, sanitize_phone
 from app.domains.shared.crud.admin import AdminCRUD
 
 logger = get_logger(__name__)
 
+# orjson serializes UUIDs and datetimes natively in C, replacing the old
+# convert_for_json pre-pass that walked the whole summary dict in Python.
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_UUID | orjson.OPT_UTC_Z
 
-def convert_for_json(obj):
-    """Recursively convert UUIDs and datetimes in dicts/lists to strings for JSON serialization."""
-    if isinstance(obj, dict):
-        return {k: convert_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_for_json(i) for i in obj]
-    elif isinstance(obj, UUID):
-        return str(obj)
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    else:
-        return obj
+# Key bytes hoisted once: PyJWT otherwise re-encodes the secret string
+# on every sign/verify call.
+_SECRET_BYTES = settings.SECRET_KEY.encode("utf-8")
+
+# Decoded verification tokens, keyed by token digest. Retry storms and
+# link-preview bots hit the verify URL with the same token repeatedly;
+# a short TTL lets repeats skip the HMAC check while expiry is still
+# re-validated on every hit. Failures are never cached.
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+
+# Cached-profile payloads are written by us and only ever read back as
+# JSON, so serialization goes straight from ORM attributes through
+# orjson — no UserRead construction or field revalidation per write.
+_CACHED_USER_FIELDS = tuple(UserRead.model_fields)
+
+# Negative-cache sentinel stored under the profile key for IDs that
+# recently missed, so repeated lookups of a deleted/unknown user skip
+# the DB round-trip. Kept short-lived: a user created in the window
+# overwrites it via the create_user cache write.
+_NX_SENTINEL = "__NX__"
+_NX_TTL = 10
+
+
+def _profile_key(user_id: UUID) -> str:
+    """Profile cache key. UUID.hex skips the hyphen-insertion pass of str()."""
+    return f"user_profile:{user_id.hex}"
+
+
+def _user_to_cache_bytes(user: User) -> bytes:
+    """Serialize a user's cacheable fields without building a schema."""
+    return orjson.dumps(
+        {k: getattr(user, k) for k in _CACHED_USER_FIELDS},
+        option=_ORJSON_OPTS,
+    )
+
+
+def _decode_verification_token(token: str) -> Dict[str, Any]:
+    """Decode an email-verification JWT, memoizing successful decodes."""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        if payload["exp"] <= time.time():
+            raise ExpiredSignatureError("Signature has expired")
+        return payload
+    payload = jwt.decode(token, _SECRET_BYTES, algorithms=["HS256"])
+    with _jwt_cache_lock:
+        _jwt_cache[key] = payload
+    return payload
 
 
 class UserService:
     """Business logic layer for user operations."""
 
-    def __init__(self, user_crud: UserCRUD, audit_crud: AuditLogCRUD, cache: RedisCache = None):
+    def __init__(
+        self,
+        user_crud: UserCRUD,
+        audit_crud: AuditLogCRUD,
+        cache: RedisCache = None,
+        admin_crud: Optional[AdminCRUD] = None,
+    ):
         self.user_crud = user_crud
         self.audit_crud = audit_crud
-        self.cache = cache or RedisCache(settings.REDIS_URL)
+        self.admin_crud = admin_crud or AdminCRUD(user_crud.db)
+        # Default cache rides the process-wide shared connection pool.
+        self.cache = cache or RedisCache()
 
     async def _log_audit(
         self,
@@ -58,8 +112,13 @@ class UserService:
         user_agent: Optional[str] = None,
         details: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Helper to create audit log entries."""
-        await self.audit_crud.create(AuditLogCreate(
+        """Queue an audit entry on the write-behind buffer.
+
+        The background flusher batches entries into one insert per
+        drain, so mutating operations no longer pay an INSERT plus
+        commit round-trip apiece.
+        """
+        audit_buffer.enqueue(AuditLogCreate(
             user_id=user_id,
             action=action,
             entity_type=entity_type,
@@ -70,6 +129,17 @@ class UserService:
             created_at=utcnow(),
         ))
 
+    async def _run_side_effects(self, *coros) -> None:
+        """Run independent post-write side effects (audit, cache) concurrently.
+
+        One round-trip each to the DB and Redis; a failure in one is
+        logged without cancelling or masking the other.
+        """
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Post-write side effect failed: %s", result)
+
     async def create_user(
         self,
         user_data: UserCreate,
@@ -85,16 +155,18 @@ class UserService:
                 user_data.phone_number = sanitize_phone(user_data.phone_number)
 
             user = await self.user_crud.create(user_data)
-            await self._log_audit(
-                user_id=created_by or user.id,
-                action="USER_CREATED",
-                entity_id=str(user.id),
-                ip_address=ip_address,
-                details={"username": user.username, "email": user.email},
+            # Audit insert and profile-cache write are independent; overlap
+            # their round-trips instead of awaiting them back to back.
+            await self._run_side_effects(
+                self._log_audit(
+                    user_id=created_by or user.id,
+                    action="USER_CREATED",
+                    entity_id=str(user.id),
+                    ip_address=ip_address,
+                    details={"username": user.username, "email": user.email},
+                ),
+                self.cache.set(_profile_key(user.id), _user_to_cache_bytes(user), expire=600),
             )
-            # Convert to Pydantic and cache the user profile
-            user_schema = UserRead.from_orm(user)
-            await self.cache.set(f"user_profile:{user.id}", user_schema.model_dump_json(), expire=600)
             logger.info("User created successfully: %s", user.username)
             return user
         except Exception:
@@ -112,35 +184,42 @@ class UserService:
 
     def _create_email_verification_token(self, user: User) -> str:
         """Create JWT token for email verification with expiry."""
-        expire = add_minutes(utcnow(), 24 * 60)
+        # exp is an epoch int anyway; time.time() skips three datetime
+        # allocations per token versus add_minutes(utcnow(), ...).
         payload = {
             "sub": str(user.id),
             "email": user.email,
-            "exp": int(expire.timestamp()),
+            "exp": int(time.time()) + 24 * 60 * 60,
             "type": "email_verification",
         }
-        token = jwt.encode(payload, settings.SECRET_KEY, algorithm="HS256")
+        token = jwt.encode(payload, _SECRET_BYTES, algorithm="HS256")
         return token
 
     async def verify_email_token(self, token: str) -> User:
         """Verify email verification token and mark user as verified."""
         try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+            payload = _decode_verification_token(token)
             if payload.get("type") != "email_verification":
                 raise AuthenticationError("Invalid token type")
 
             user_id = UUID(payload.get("sub"))
+            cache_key = _profile_key(user_id)
+            if await self.cache.get(cache_key) == _NX_SENTINEL:
+                raise NotFoundError("User not found")
             user = await self.user_crud.get_by_id(user_id)
             if not user:
+                await self.cache.set(cache_key, _NX_SENTINEL, expire=_NX_TTL)
                 raise NotFoundError("User not found")
 
             if user.email_verified:
                 logger.info(f"User {user.email} already verified")
                 return user
 
-            await self.user_crud.update(user_id, UserUpdate(email_verified=True))
+            # update() returns the fresh row via RETURNING, so no second
+            # get_by_id round trip just to hand the caller current state.
+            updated = await self.user_crud.update(user_id, UserUpdate(email_verified=True))
             logger.info(f"User {user.email} email verified successfully")
-            return await self.user_crud.get_by_id(user_id)
+            return updated
         except ExpiredSignatureError:
             logger.warning("Email verification failed: token expired")
             raise AuthenticationError("Verification token expired")
@@ -166,9 +245,27 @@ class UserService:
             search=search,
         )
 
+    async def aiter_users(
+        self,
+        is_active: Optional[bool] = None,
+        email_verified: Optional[bool] = None,
+        search: Optional[str] = None,
+    ):
+        """Yield matching users one by one without buffering the full set."""
+        async for user in self.user_crud.stream_users(
+            is_active=is_active,
+            email_verified=email_verified,
+            search=search,
+        ):
+            yield user
+
     async def get_user(self, user_id: UUID, acting_user: Optional[User] = None) -> Optional[User]:
+        cache_key = _profile_key(user_id)
+        if await self.cache.get(cache_key) == _NX_SENTINEL:
+            return None
         user = await self.user_crud.get_by_id(user_id)
         if not user:
+            await self.cache.set(cache_key, _NX_SENTINEL, expire=_NX_TTL)
             return None
         # Only allow self or superadmin to view
         if acting_user and (acting_user.id != user_id and not is_superadmin(acting_user)):
@@ -196,31 +293,33 @@ class UserService:
         ip_address: Optional[str] = None,
     ) -> User:
         try:
-            # Sanitize fields if present
-            if user_data.email:
-                user_data.email = sanitize_email(user_data.email)
-            if user_data.username:
-                user_data.username = sanitize_username(user_data.username)
-            if hasattr(user_data, "phone_number") and user_data.phone_number:
-                user_data.phone_number = sanitize_phone(user_data.phone_number)
-
             original_user = await self.user_crud.get_by_id(user_id)
             if not original_user:
                 raise NotFoundError("User not found")
 
-            updated_user = await self.user_crud.update(user_id, user_data)
+            # One dump drives the checks; sanitize only fields that differ
+            # from the stored row — full-form updates commonly echo the
+            # existing values back unchanged.
             changes = user_data.model_dump(exclude_unset=True)
+            if changes.get("email") and changes["email"] != original_user.email:
+                user_data.email = sanitize_email(changes["email"])
+            if changes.get("username") and changes["username"] != original_user.username:
+                user_data.username = sanitize_username(changes["username"])
+            if changes.get("phone_number") and changes["phone_number"] != original_user.phone_number:
+                user_data.phone_number = sanitize_phone(changes["phone_number"])
 
-            await self._log_audit(
-                user_id=updated_by,
-                action="USER_UPDATED",
-                entity_id=str(user_id),
-                ip_address=ip_address,
-                details={"changes": list(changes.keys())},
+            updated_user = await self.user_crud.update(user_id, user_data)
+
+            await self._run_side_effects(
+                self._log_audit(
+                    user_id=updated_by,
+                    action="USER_UPDATED",
+                    entity_id=str(user_id),
+                    ip_address=ip_address,
+                    details={"changes": list(changes.keys())},
+                ),
+                self.cache.set(_profile_key(user_id), _user_to_cache_bytes(updated_user), expire=600),
             )
-            # Convert to Pydantic and update the cache
-            user_schema = UserRead.from_orm(updated_user)
-            await self.cache.set(f"user_profile:{user_id}", user_schema.model_dump_json(), expire=600)
             logger.info("User updated successfully: %s", user_id)
             return updated_user
         except Exception as e:
@@ -287,10 +386,10 @@ class UserService:
         user_id: UUID,
         days_back: int = 30,
     ) -> Dict[str, Any]:
-        cache_key = f"user_activity_summary:{user_id}:{days_back}"
+        cache_key = f"user_activity_summary:{user_id.hex}:{days_back}"
         cached = await self.cache.get(cache_key)
         if cached:
-            return json.loads(cached)
+            return orjson.loads(cached)
         try:
             user = await self.user_crud.get_by_id(user_id)
             if not user:
@@ -327,8 +426,7 @@ class UserService:
                     for log in logs[:10]
                 ],
             }
-            # Convert UUIDs before caching
-            await self.cache.set(cache_key, json.dumps(convert_for_json(summary)), expire=300)
+            await self.cache.set(cache_key, orjson.dumps(summary, option=_ORJSON_OPTS), expire=300)
             return summary
         except Exception as e:
             logger.error("User activity summary failed: %s", e)
@@ -357,12 +455,15 @@ class UserService:
         try:
             success = await self.user_crud.soft_delete(user_id)
             if success:
-                await self._log_audit(
-                    user_id=deleted_by or user_id,
-                    action="USER_SOFT_DELETED",
-                    entity_id=str(user_id),
-                    ip_address=ip_address,
-                    details={"reason": reason} if reason else None,
+                await self._run_side_effects(
+                    self._log_audit(
+                        user_id=deleted_by or user_id,
+                        action="USER_SOFT_DELETED",
+                        entity_id=str(user_id),
+                        ip_address=ip_address,
+                        details={"reason": reason} if reason else None,
+                    ),
+                    self.cache.delete(_profile_key(user_id)),
                 )
                 logger.info("User soft deleted successfully: %s", user_id)
             return success
@@ -375,8 +476,7 @@ class UserService:
         user_id: UUID,
         acting_user: Optional[User] = None,
     ) -> bool:
-        admin_crud = AdminCRUD(self.user_crud.db)
-        admin = await admin_crud.get_by_user_id(user_id)
+        admin = await self.admin_crud.get_by_user_id(user_id)
         # Only superadmin or self can delete admin users
         if admin:
             if not acting_user or (not is_superadmin(acting_user) and acting_user.id != user_id):
@@ -392,14 +492,19 @@ class UserService:
         acting_user: Optional[User] = None,
     ) -> bool:
         try:
-            await self._log_audit(
-                user_id=user_id,
-                action="USER_HARD_DELETED",
-                entity_id=str(user_id),
-            )
             success = await self.user_crud.delete(user_id)
             if success:
-                await self.cache.delete(f"user_profile:{user_id}")
+                # Audit written after the delete (a row logged before it
+                # would be swept by the FK cascade anyway), overlapped
+                # with the cache eviction.
+                await self._run_side_effects(
+                    self._log_audit(
+                        user_id=None,
+                        action="USER_HARD_DELETED",
+                        entity_id=str(user_id),
+                    ),
+                    self.cache.delete(_profile_key(user_id)),
+                )
                 logger.info("User hard deleted successfully: %s", user_id)
             return success
         except Exception as e:
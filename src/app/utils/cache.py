@@ -1,10 +1,25 @@
 import redis.asyncio as redis
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List, Sequence
+
+from src.app.config import settings
+
+# One connection pool per process: every redis.from_url call otherwise
+# preallocates its own sockets and health checker, so service instances
+# created per request would each drag a private pool along.
+_SHARED_POOL = redis.ConnectionPool.from_url(
+    settings.REDIS_URL,
+    encoding="utf-8",
+    decode_responses=True,
+    max_connections=64,
+)
 
 
 class RedisCache:
-    def __init__(self, url: str):
-        self._client = redis.from_url(url, encoding="utf-8", decode_responses=True)
+    def __init__(self, url: Optional[str] = None):
+        if url is None:
+            self._client = redis.Redis(connection_pool=_SHARED_POOL)
+        else:
+            self._client = redis.from_url(url, encoding="utf-8", decode_responses=True)
 
     async def get(self, key: str) -> Optional[str]:
         return await self._client.get(key)
@@ -15,5 +30,24 @@ class RedisCache:
     async def delete(self, key: str):
         await self._client.delete(key)
 
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Fetch several keys in one round trip."""
+        if not keys:
+            return []
+        return await self._client.mget(keys)
+
+    async def mset(self, mapping: Dict[str, Any], expire: int = 3600):
+        """Set several keys with a shared TTL in one round trip."""
+        if not mapping:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipe.set(key, value, ex=expire)
+        await pipe.execute()
+
+    def pipeline(self):
+        """Raw non-transactional pipeline for callers batching mixed commands."""
+        return self._client.pipeline(transaction=False)
+
     async def close(self):
         await self._client.close()
@@ -1,9 +1,18 @@
+import orjson
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
+from httpx import AsyncClient, ASGITransport, Response
 from src.app.main import app
 
+# Decode response bodies with orjson instead of stdlib json; the app
+# already serializes through ORJSONResponse, so both halves of every
+# request/assert round trip skip the pure-Python parser.
+Response.json = lambda self, **_: orjson.loads(self.content)
 
-@pytest_asyncio.fixture
+
+# Session scope: the client, its ASGI transport, and the app's route
+# table are built once and shared across the suite instead of being
+# reconstructed per test.
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac: